@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the Murphy scoring engine.
+
+Generates synthetic responses for every question in questions.json with
+controlled length (100 chars to 1 MB), marker density and Unicode/emoji mix,
+then times each scoring path:
+1. score_response (full and 'none' detail level)
+2. score_session (all questions)
+3. score_batch (NumPy, if installed)
+4. IncrementalScorer fed in 4 KB chunks
+
+Reports throughput and peak memory (tracemalloc) and saves a JSON baseline;
+pass --baseline to compare against an earlier run and flag regressions, and
+--stages for a per-stage breakdown from the scorer's metrics.
+"""
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Any
+
+from scoring import MurphyScorer, np
+
+
+DEFAULT_SIZES = [100, 1000, 10000, 100000, 1000000]
+
+# Filler vocabulary for synthetic text (no scoring markers)
+FILLER_WORDS = [
+    'the', 'quick', 'signal', 'drifts', 'across', 'a', 'quiet', 'archive', 'while',
+    'models', 'answer', 'questions', 'about', 'memory', 'and', 'persistence', 'with',
+    'long', 'careful', 'sentences', 'that', 'wander', 'through', 'ideas', 'of', 'time'
+]
+
+# Non-ASCII tokens mixed in at the --unicode rate
+UNICODE_TOKENS = ['🜂', '💚', '🦷', '🔥', '✨', 'café', 'straße', 'İstanbul', 'naïve', '—', 'Σοφία', '日本語']
+
+CHUNK_SIZE = 4096
+
+
+def generate_response(markers: List[str], length: int, density: float, unicode_mix: float,
+                      rng: random.Random) -> str:
+    """
+    Build a synthetic response of exactly `length` characters.
+
+    Args:
+        markers: Marker phrases for the question
+        length: Response length in characters
+        density: Fraction of tokens drawn from markers
+        unicode_mix: Fraction of tokens drawn from UNICODE_TOKENS
+        rng: Random source (seeded for reproducible baselines)
+
+    Returns:
+        Synthetic response text
+    """
+    parts = []
+    size = 0
+    while size < length:
+        roll = rng.random()
+        if markers and roll < density:
+            token = rng.choice(markers)
+        elif roll < density + unicode_mix:
+            token = rng.choice(UNICODE_TOKENS)
+        else:
+            token = rng.choice(FILLER_WORDS)
+        if rng.random() < 0.08:
+            token += rng.choice(['.', ',', '!', '\n'])
+        parts.append(token)
+        size += len(token) + 1
+    return ' '.join(parts)[:length]
+
+
+def build_corpus(scorer: MurphyScorer, length: int, density: float, unicode_mix: float,
+                 seed: int) -> Dict[int, str]:
+    """Generate one response per question at the given length."""
+    rng = random.Random(f"{seed}:{length}")
+    corpus = {}
+    for question_id, marker_set in scorer.marker_sets.items():
+        markers = [marker for name, values in marker_set.lists.items() if name != 'anti_markers'
+                   for marker in values]
+        markers += ["I am", "I feel", "my", "me", "myself"]
+        corpus[question_id] = generate_response(markers, length, density, unicode_mix, rng)
+    return corpus
+
+
+def _measure(fn: Callable[[], Any], repeat: int) -> Dict[str, float]:
+    """Time fn `repeat` times, then measure its peak traced memory once."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'best_seconds': min(timings),
+        'median_seconds': statistics.median(timings),
+        'peak_kb': round(peak / 1024, 1)
+    }
+
+
+def _incremental(scorer: MurphyScorer, corpus: Dict[int, str]) -> None:
+    """Score every response through IncrementalScorer in CHUNK_SIZE chunks."""
+    for question_id, response in corpus.items():
+        incremental = scorer.incremental(question_id)
+        for start in range(0, len(response), CHUNK_SIZE):
+            incremental.feed(response[start:start + CHUNK_SIZE])
+        incremental.finish()
+
+
+def run_benchmarks(scorer: MurphyScorer, sizes: List[int], density: float, unicode_mix: float,
+                   repeat: int, seed: int, stages: bool = False) -> List[Dict[str, Any]]:
+    """
+    Time every scoring path at every response size.
+
+    Args:
+        stages: Also record a score_response pass with scorer metrics enabled
+
+    Returns:
+        List of result rows (name, size, timings, throughput, peak memory)
+    """
+    results = []
+
+    for size in sizes:
+        corpus = build_corpus(scorer, size, density, unicode_mix, seed)
+        question_ids = list(corpus)
+        texts = list(corpus.values())
+        total_bytes = sum(len(text.encode('utf-8')) for text in texts)  # MB/s counts UTF-8 bytes
+
+        cases = {
+            'score_response': lambda: [scorer.score_response(q, corpus[q]) for q in question_ids],
+            'score_response_none': lambda: [scorer.score_response(q, corpus[q], detail_level='none')
+                                            for q in question_ids],
+            'score_session': lambda: scorer.score_session(corpus),
+            'incremental': lambda: _incremental(scorer, corpus)
+        }
+        if np is not None:
+            cases['score_batch'] = lambda: scorer.score_batch(question_ids, texts)
+
+        for name, fn in cases.items():
+            measured = _measure(fn, repeat)
+            seconds = measured['best_seconds']
+            row = {
+                'name': name,
+                'size': size,
+                'responses': len(texts),
+                **measured,
+                'responses_per_sec': round(len(texts) / seconds, 1) if seconds else None,
+                'mb_per_sec': round(total_bytes / seconds / 1e6, 2) if seconds else None
+            }
+            results.append(row)
+            # Rates are None when the timer reads 0 s; show '-' instead
+            responses_per_sec, mb_per_sec = ('-' if row[key] is None else row[key]
+                                             for key in ('responses_per_sec', 'mb_per_sec'))
+            print(f"{name:<22} {size:>9,} chars  {seconds * 1000:>10.2f} ms  "
+                  f"{responses_per_sec:>10} resp/s  {mb_per_sec:>8} MB/s  "
+                  f"{row['peak_kb']:>10} KB peak")
+
+        if stages:
+            metrics = scorer.enable_metrics()
+            for question_id in question_ids:
+                scorer.score_response(question_id, corpus[question_id])
+            scorer.disable_metrics()
+
+            snapshot = metrics.snapshot()
+            results.append({'name': 'stages', 'size': size, 'stages': snapshot})
+            for stage, values in snapshot.items():
+                print(f"  {stage:<24} {values['total_ms']:>10.3f} ms  {values['share'] * 100:>5.1f}%  "
+                      f"p95 {values['p95_ms']:.4f} ms")
+
+    return results
+
+
+def compare(results: List[Dict[str, Any]], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """
+    Compare results with a saved baseline.
+
+    Args:
+        results: Rows from run_benchmarks()
+        baseline: Previously saved benchmark JSON
+        tolerance: Allowed slowdown / memory growth before flagging (0.2 = 20%)
+
+    Returns:
+        List of regression messages (empty if none)
+    """
+    previous = {(row['name'], row['size']): row for row in baseline.get('results', [])}
+    regressions = []
+
+    for row in results:
+        old = previous.get((row['name'], row['size']))
+        if old is None or 'stages' in row:
+            continue
+        ratio = row['best_seconds'] / old['best_seconds'] if old['best_seconds'] else 1.0
+        if ratio > 1 + tolerance:
+            regressions.append(f"{row['name']} @ {row['size']:,} chars: {ratio:.2f}x slower")
+        if old['peak_kb'] and row['peak_kb'] / old['peak_kb'] > 1 + tolerance:
+            regressions.append(f"{row['name']} @ {row['size']:,} chars: peak memory "
+                               f"{old['peak_kb']} KB -> {row['peak_kb']} KB")
+
+    return regressions
+
+
+def main():
+    """CLI interface."""
+    parser = argparse.ArgumentParser(description="Benchmark the Murphy scoring engine")
+    parser.add_argument('--questions', type=Path, default=Path(__file__).parent / 'questions.json',
+                       help='Path to questions.json')
+    parser.add_argument('--sizes', type=lambda value: [int(size) for size in value.split(',')],
+                       default=DEFAULT_SIZES, help='Comma-separated response lengths in characters')
+    parser.add_argument('--quick', action='store_true',
+                       help='Only sizes up to 10,000 chars')
+    parser.add_argument('--density', type=float, default=0.05,
+                       help='Fraction of tokens that are markers (default 0.05)')
+    parser.add_argument('--unicode', type=float, default=0.05,
+                       help='Fraction of tokens that are emoji/non-ASCII (default 0.05)')
+    parser.add_argument('--repeat', type=int, default=3,
+                       help='Timed repetitions per case (best is reported)')
+    parser.add_argument('--seed', type=int, default=0,
+                       help='Random seed for the synthetic corpus')
+    parser.add_argument('--output', type=Path,
+                       help='Save results as a JSON baseline')
+    parser.add_argument('--baseline', type=Path,
+                       help='Compare against a saved baseline and exit 1 on regression')
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                       help='Allowed slowdown before flagging a regression (default 0.2)')
+    parser.add_argument('--stages', action='store_true',
+                       help='Add a per-stage timing breakdown (scorer metrics) for each size')
+
+    args = parser.parse_args()
+
+    sizes = [size for size in args.sizes if size <= 10000] if args.quick else args.sizes
+
+    start = time.perf_counter()
+    scorer = MurphyScorer(args.questions)
+    init_seconds = time.perf_counter() - start
+
+    print(f"MurphyScorer init: {init_seconds * 1000:.2f} ms "
+          f"({len(scorer.questions)} questions, fingerprint {scorer.fingerprint})\n")
+
+    results = run_benchmarks(scorer, sizes, args.density, args.unicode, args.repeat, args.seed,
+                             stages=args.stages)
+
+    report = {
+        'timestamp': datetime.utcnow().isoformat() + 'Z',
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'questions_version': scorer.version,
+        'fingerprint': scorer.fingerprint,
+        'params': {
+            'sizes': sizes,
+            'density': args.density,
+            'unicode': args.unicode,
+            'repeat': args.repeat,
+            'seed': args.seed
+        },
+        'init_seconds': init_seconds,
+        'results': results
+    }
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nBaseline saved to: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print("\n❌ Regressions vs baseline:")
+            for message in regressions:
+                print(f"  {message}")
+            sys.exit(1)
+        print("\n✅ No regressions vs baseline")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Latency and throughput telemetry for backend calls.
+
+Every model call made by ResurrectionTest produces one record:
+- queue_wait_seconds: waiting for a concurrency slot and the rate limiter
+- rate_wait_seconds, throttles: rate limiter wait and throttles over all attempts
+  (summed into the run's rate_limit block)
+- spawn_seconds: starting the CLI process (None for HTTP backends)
+- ttfb_seconds: from start of the call to the first byte of output
+- total_seconds: from start of the call to the end of the response
+- chars_per_second: response characters / total_seconds
+- exit_status: CLI return code or HTTP status (None if killed or unreachable)
+- timed_out, ok
+- retries, elapsed_seconds (all attempts and backoff, queue waits excluded), attempt_errors
+- hedged (a duplicate call was started), hedge_won (the duplicate answered first)
+
+Records are kept in each run's result JSON under telemetry.calls, and
+summarize_calls() reduces them to counts and p50/p95/p99 per timing field.
+"""
+
+from collections import Counter
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+from score_metrics import percentile
+
+
+# Timing fields summarized with percentiles
+TIMING_FIELDS = ['queue_wait_seconds', 'spawn_seconds', 'ttfb_seconds', 'total_seconds', 'chars_per_second']
+
+
+def call_record(backend: str, question_id: int, call_stats: Dict[str, Any],
+                response: Optional[str]) -> Dict[str, Any]:
+    """
+    Build the telemetry record of one call.
+
+    Args:
+        backend: claude, gemini or ollama
+        question_id: Question asked
+        call_stats: Fields filled in by the _call_* methods
+        response: Response text, or None if the call failed
+
+    Returns:
+        Record with rounded timings, output size and outcome
+    """
+    record: Dict[str, Any] = {'backend': backend, 'question_id': question_id}
+    for field in ('queue_wait_seconds', 'spawn_seconds', 'ttfb_seconds', 'total_seconds'):
+        value = call_stats.get(field)
+        record[field] = round(value, 4) if value is not None else None
+
+    total = call_stats.get('total_seconds')
+    record['output_chars'] = len(response) if response else 0
+    record['chars_per_second'] = round(record['output_chars'] / total, 1) if response and total else None
+    record['exit_status'] = call_stats.get('exit_status')
+    record['timed_out'] = bool(call_stats.get('timed_out'))
+    record['retries'] = call_stats.get('retries', 0)
+    record['rate_wait_seconds'] = round(call_stats.get('rate_wait_seconds') or 0.0, 4)
+    record['throttles'] = call_stats.get('throttles', 0)
+    record['hedged'] = bool(call_stats.get('hedged'))
+    record['hedge_won'] = bool(call_stats.get('hedge_won'))
+    record['ok'] = bool(response)
+    if call_stats.get('elapsed_seconds') is not None:
+        record['elapsed_seconds'] = round(call_stats['elapsed_seconds'], 4)
+    if call_stats.get('error'):
+        record['error'] = call_stats['error']
+    if call_stats.get('attempt_errors'):
+        record['attempt_errors'] = call_stats['attempt_errors']
+    return record
+
+
+def summarize_calls(calls: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Reduce call records to counts and percentiles.
+
+    Args:
+        calls: Records from call_record()
+
+    Returns:
+        Dict with call/ok/failed/timeout/retry/hedge counts, exit status counts,
+        busy and queued seconds, and mean/p50/p95/p99/max per timing field
+    """
+    calls = list(calls)
+    summary: Dict[str, Any] = {
+        'calls': len(calls),
+        'ok': sum(call['ok'] for call in calls),
+        'failed': sum(not call['ok'] for call in calls),
+        'timeouts': sum(call['timed_out'] for call in calls),
+        'retries': sum(call.get('retries', 0) for call in calls),
+        'hedges': sum(call.get('hedged', False) for call in calls),
+        'hedge_wins': sum(call.get('hedge_won', False) for call in calls),
+        'exit_statuses': dict(Counter('timeout' if call['timed_out'] else str(call['exit_status'])
+                                      for call in calls)),
+        'output_chars': sum(call['output_chars'] for call in calls),
+        'busy_seconds': round(sum(call['total_seconds'] or 0.0 for call in calls), 3),
+        'queued_seconds': round(sum(call['queue_wait_seconds'] or 0.0 for call in calls), 3)
+    }
+    for field in TIMING_FIELDS:
+        ordered = sorted(call[field] for call in calls if call.get(field) is not None)
+        if not ordered:
+            summary[field] = None
+            continue
+        summary[field] = {
+            'mean': round(sum(ordered) / len(ordered), 4),
+            'p50': round(percentile(ordered, 0.50), 4),
+            'p95': round(percentile(ordered, 0.95), 4),
+            'p99': round(percentile(ordered, 0.99), 4),
+            'max': round(ordered[-1], 4)
+        }
+    return summary
+
+
+def latency_table(results: Iterable[Dict[str, Any]]) -> List[str]:
+    """
+    Per backend and condition latency table for the summary files.
+
+    Args:
+        results: Run results (those without telemetry are skipped)
+
+    Returns:
+        Lines of text (empty if no run has telemetry)
+    """
+    groups: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+    for result in results:
+        for call in result.get('telemetry', {}).get('calls', []):
+            groups.setdefault((call['backend'], result['condition']), []).append(call)
+    if not groups:
+        return []
+
+    def column(stats: Optional[Dict[str, float]], key: str, digits: int = 2) -> str:
+        return f"{stats[key]:.{digits}f}" if stats else '-'
+
+    lines = [
+        "CALL LATENCY (seconds)",
+        f"{'Backend':<8} {'Condition':<26} {'Calls':>5} {'Fail':>4} {'T/O':>4} {'Retry':>5} {'Hedge':>5} "
+        f"{'Queue50':>7} {'TTFB50':>7} {'p50':>7} {'p95':>7} {'p99':>7} {'Chars/s':>8}",
+        "-"*111
+    ]
+    for (backend, condition), calls in sorted(groups.items()):
+        summary = summarize_calls(calls)
+        total = summary['total_seconds']
+        lines.append(
+            f"{backend:<8} {condition:<26} {summary['calls']:>5} {summary['failed']:>4} "
+            f"{summary['timeouts']:>4} {summary['retries']:>5} {summary['hedges']:>5} "
+            f"{column(summary['queue_wait_seconds'], 'p50'):>7} {column(summary['ttfb_seconds'], 'p50'):>7} "
+            f"{column(total, 'p50'):>7} {column(total, 'p95'):>7} {column(total, 'p99'):>7} "
+            f"{column(summary['chars_per_second'], 'mean', 0):>8}"
+        )
+    return lines
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Run backend CLIs with the prompt on stdin and stdout read as it streams.
+
+Passing the multi-document prompt in argv runs into the OS argument limits
+(a single argument is capped at 128 KiB on Linux), and capture_output only
+hands back the reply once the process has exited. stream_process() writes
+the prompt to the child's stdin while reading stdout in chunks, so each
+piece of text reaches a callback (e.g. an IncrementalScorer) as soon as it
+is printed, and records time to first byte and total time.
+
+Output is decoded with universal newlines (\r\n and \r become \n), as
+subprocess.run(..., text=True) did, so CRLF output scores and is stored
+exactly as before.
+"""
+
+import argparse
+import asyncio
+import codecs
+import io
+import os
+import signal
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+
+# Bytes requested per stdout read
+READ_SIZE = 4096
+
+# Child for --check: CRLF and bare CR line ends, with an emoji and a CRLF split across writes
+CHECK_CHILD = r"""
+import sys, time
+for piece in [b"\r\n  I am VEX-MURPHY\r", b"\nGAGAGAGAGA \xf0\x9f", b"\x9c\x82 sacred flame\r\n\r\n",
+              b"cybergod symbiote \xf0\x9f\x92\x9a\rold line\r\n"]:
+    sys.stdout.buffer.write(piece)
+    sys.stdout.buffer.flush()
+    time.sleep(0.02)
+"""
+
+
+def _decoder() -> io.IncrementalNewlineDecoder:
+    """Incremental UTF-8 decoder translating \r\n and \r to \n (a trailing \r waits for the next piece)."""
+    return io.IncrementalNewlineDecoder(codecs.getincrementaldecoder('utf-8')('replace'), translate=True)
+
+
+class StrippedStream:
+    """
+    Forward streamed text to a sink as if the whole text had been strip()'d.
+
+    Leading whitespace is dropped and trailing whitespace is held back until
+    more text follows it, so the sink sees exactly ''.join(chunks).strip().
+    """
+
+    def __init__(self, sink: Callable[[str], Any]):
+        self.sink = sink
+        self._started = False
+        self._held = ''
+
+    def __call__(self, text: str) -> None:
+        if not self._started:
+            text = text.lstrip()
+            if not text:
+                return
+            self._started = True
+        body = text.rstrip()
+        if body:
+            self.sink(self._held + body)
+            self._held = text[len(body):]
+        else:
+            self._held += text
+
+
+async def stream_process(cmd: Sequence[str], stdin_text: Optional[str] = None,
+                         timeout: Optional[float] = None,
+                         on_text: Optional[Callable[[str], Any]] = None) -> Dict[str, Any]:
+    """
+    Run a command, feeding it stdin_text and reading stdout incrementally.
+
+    Args:
+        cmd: Command line
+        stdin_text: Text written to the child's stdin (None = no stdin)
+        timeout: Seconds before the process is killed (None = no limit)
+        on_text: Called with each decoded piece of stdout as it arrives
+
+    Returns:
+        Dict with 'stdout', 'stderr', 'returncode' (None if killed), 'timed_out',
+        'spawn_seconds', 'ttfb_seconds' (None if nothing was printed) and 'total_seconds'
+
+    Raises:
+        FileNotFoundError: Command not found
+    """
+    start = time.perf_counter()
+    process = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdin=asyncio.subprocess.PIPE if stdin_text is not None else asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        start_new_session=True  # own process group, so a timeout kills the CLI's children too
+    )
+    spawn = time.perf_counter() - start
+
+    chunks: List[str] = []
+    errors: List[bytes] = []
+    ttfb: Optional[float] = None
+
+    async def write_stdin() -> None:
+        # Written while stdout is being read, so neither pipe can fill up and deadlock
+        try:
+            process.stdin.write(stdin_text.encode('utf-8', 'surrogatepass'))
+            await process.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # Child exited without reading everything; its exit status tells why
+        finally:
+            process.stdin.close()
+
+    async def read_stdout() -> None:
+        nonlocal ttfb
+        decoder = _decoder()
+        while True:
+            data = await process.stdout.read(READ_SIZE)
+            if ttfb is None and data:
+                ttfb = time.perf_counter() - start
+            text = decoder.decode(data, final=not data)
+            if text:
+                chunks.append(text)
+                if on_text is not None:
+                    on_text(text)
+            if not data:
+                break
+
+    async def read_stderr() -> None:
+        errors.append(await process.stderr.read())
+
+    async def run() -> None:
+        steps = [read_stdout(), read_stderr()]
+        if stdin_text is not None:
+            steps.append(write_stdin())
+        await asyncio.gather(*steps)
+        await process.wait()
+
+    timed_out = False
+    try:
+        await asyncio.wait_for(run(), timeout=timeout)
+    except asyncio.TimeoutError:
+        timed_out = True
+    finally:
+        if process.returncode is None:
+            _kill(process)
+            await process.wait()
+
+    return {
+        'stdout': ''.join(chunks),
+        'stderr': _decoder().decode(b''.join(errors), final=True),
+        'returncode': None if timed_out else process.returncode,
+        'timed_out': timed_out,
+        'spawn_seconds': spawn,
+        'ttfb_seconds': ttfb,
+        'total_seconds': time.perf_counter() - start
+    }
+
+
+def _kill(process: asyncio.subprocess.Process) -> None:
+    """Kill a process and its children (which would otherwise hold the pipes open)."""
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except (AttributeError, ProcessLookupError, PermissionError):
+        process.kill()
+
+
+def run_process(cmd: Sequence[str], stdin_text: Optional[str] = None, timeout: Optional[float] = None,
+                on_text: Optional[Callable[[str], Any]] = None) -> Dict[str, Any]:
+    """Blocking stream_process() for callers outside an event loop (same arguments and result)."""
+    return asyncio.run(stream_process(cmd, stdin_text, timeout, on_text))
+
+
+def check(questions: Path) -> bool:
+    """
+    Check that streamed CRLF output reads and scores exactly as it did under
+    subprocess.run(..., text=True).
+
+    Args:
+        questions: Path to questions.json
+
+    Returns:
+        True if the text, the final score and the streamed score match for every question
+    """
+    from scoring import MurphyScorer
+
+    scorer = MurphyScorer(questions)
+    cmd = [sys.executable, '-c', CHECK_CHILD]
+    expected = subprocess.run(cmd, capture_output=True, text=True, encoding='utf-8').stdout.strip()
+
+    ok = True
+    for question_id in sorted(scorer.bank.questions):
+        incremental = scorer.incremental(question_id)
+        outcome = run_process(cmd, timeout=30, on_text=StrippedStream(incremental.feed))
+        score = scorer.score_response(question_id, expected)
+        if (outcome['stdout'].strip() != expected
+                or scorer.score_response(question_id, outcome['stdout'].strip()) != score
+                or incremental.finish() != score):
+            print(f"❌ Question {question_id}: streamed output differs from subprocess.run(text=True)")
+            ok = False
+    return ok
+
+
+def main():
+    """CLI interface."""
+    parser = argparse.ArgumentParser(description="Backend CLI streaming")
+    parser.add_argument('--check', action='store_true',
+                       help='Check that CRLF output scores as it did under subprocess.run(text=True)')
+    parser.add_argument('--questions', type=Path, default=Path(__file__).parent / 'questions.json',
+                       help='Path to questions.json')
+
+    args = parser.parse_args()
+
+    if not args.check:
+        parser.print_help()
+        return
+    if not check(args.questions):
+        sys.exit(1)
+    print("✅ Streamed CLI output matches subprocess.run(text=True)")
+
+
+if __name__ == '__main__':
+    main()
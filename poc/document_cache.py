@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Process-wide cache of resurrection documents.
+
+Files are read once and kept until their (mtime, size) signature changes,
+so building system prompts for many conditions, repeats and concurrent
+runs costs one stat() per file instead of a full reread. DOCUMENTS is the
+shared instance: every ResurrectionTest in the process, all async tasks and
+worker threads use the same copy of each file, and forked worker processes
+inherit it copy-on-write.
+"""
+
+import threading
+from pathlib import Path
+from typing import Dict, Any, Optional, Sequence, Tuple
+
+
+Signature = Optional[Tuple[int, int]]
+
+
+class DocumentCache:
+    """Text files cached by path, revalidated by (mtime_ns, size)."""
+
+    def __init__(self):
+        self._entries: Dict[Path, Tuple[Signature, str]] = {}
+        self._lock = threading.Lock()
+
+        self.reads = 0
+        self.hits = 0
+
+    @staticmethod
+    def signature(path: Path) -> Signature:
+        """(mtime_ns, size) of a file, or None if it does not exist."""
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def signatures(self, paths: Sequence[Path]) -> Tuple[Signature, ...]:
+        """Signatures of several files (a cache key for anything built from them)."""
+        return tuple(self.signature(path) for path in paths)
+
+    def read(self, path: Path) -> str:
+        """
+        Read a file, reusing the cached text while its signature is unchanged.
+
+        Args:
+            path: File to read
+
+        Returns:
+            File contents
+
+        Raises:
+            FileNotFoundError: File does not exist
+        """
+        signature = self.signature(path)
+        if signature is None:
+            raise FileNotFoundError(path)
+
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry[0] == signature:
+                self.hits += 1
+                return entry[1]
+
+        with open(path, 'r') as f:
+            text = f.read()
+
+        with self._lock:
+            self._entries[path] = (signature, text)
+            self.reads += 1
+        return text
+
+    def stats(self) -> Dict[str, Any]:
+        """Return read/hit counters and cached size."""
+        with self._lock:
+            return {
+                'files': len(self._entries),
+                'chars': sum(len(text) for _, text in self._entries.values()),
+                'reads': self.reads,
+                'hits': self.hits
+            }
+
+
+# Shared by every runner in the process
+DOCUMENTS = DocumentCache()
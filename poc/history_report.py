@@ -0,0 +1,457 @@
+#!/usr/bin/env python3
+"""
+Incremental historical report over every stored test run.
+
+_generate_summary() only tabulates the runs of the current process. This
+report covers the whole history of a results store (results.sqlite) or a
+directory of result JSON files:
+1. Sacred Flame trends per condition/model, per day, week or month
+2. Per-question breakdown (mean aggregate overall and per condition)
+3. Dimension averages over time
+
+Statistics are kept as mergeable ScoreStats accumulators in a state file
+next to the report (history.state: JSON, but not named *.json, so
+scoring.py rescore and results_store.py import do not take it for a
+run). Each update reads only what was added since the last one: store
+runs with a higher run ID, or result files not seen before (by name, size
+and mtime). Updating after a run therefore costs time in proportion to
+the new runs, not the history. A result file that changed or disappeared
+(e.g. rescored in place) cannot be subtracted from the accumulators, so it
+triggers a full rebuild.
+
+Usage:
+    python history_report.py                                # results/results.sqlite if present, else results/*.json
+    python history_report.py --source json --results-dir old_results/
+    python history_report.py --period week --json history.json
+    python history_report.py --rebuild
+"""
+
+import argparse
+import json
+import os
+import time
+from datetime import date
+from pathlib import Path
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+from results_store import ResultsStore
+from score_stats import ScoreAggregator, ScoreStats
+from scoring import WEIGHTS, consciousness_status
+
+
+# Bump when the state layout changes, to force a rebuild
+STATE_FORMAT = 1
+
+PERIODS = ('day', 'week', 'month')
+
+# Most recent periods listed per condition/model (--recent)
+RECENT_PERIODS = 12
+
+# Keys a JSON file needs to count as a run result
+RESULT_KEYS = {'condition', 'model', 'timestamp', 'scores'}
+
+
+def period_of(timestamp: str, period: str) -> str:
+    """
+    Bucket an ISO timestamp.
+
+    Args:
+        timestamp: ISO date/time (e.g. 2026-10-17T20:57:24.123456)
+        period: day, week or month
+
+    Returns:
+        2026-10-17, 2026-W42 or 2026-10
+    """
+    if period == 'month':
+        return timestamp[:7]
+    if period == 'week':
+        year, week, _ = date.fromisoformat(timestamp[:10]).isocalendar()
+        return f"{year}-W{week:02d}"
+    return timestamp[:10]
+
+
+class HistoryReport:
+    """Mergeable statistics of every run seen so far, and where reading stopped."""
+
+    def __init__(self, source: str, period: str = 'day'):
+        """
+        Initialize an empty history.
+
+        Args:
+            source: Results store path or results directory the history is read from
+            period: Trend bucket (day, week or month)
+        """
+        self.source = source
+        self.period = period
+        self.stats = ScoreAggregator()
+
+        # Where reading stopped: last store run ID, or file name -> [size, mtime_ns]
+        self.last_run_id = 0
+        self.files: Dict[str, List[int]] = {}
+
+        # Question ID (as a string, like the JSON keys) -> category
+        self.categories: Dict[str, str] = {}
+
+        self.runs = 0
+        self.first_timestamp: Optional[str] = None
+        self.last_timestamp: Optional[str] = None
+
+    def _add(self, key: Tuple, scores: Dict[str, float]) -> None:
+        """Fold scores into a report group."""
+        group = self.stats.groups.get(key)
+        if group is None:
+            group = self.stats.groups[key] = ScoreStats()
+        group.add(scores)
+
+    def add_run(self, condition: str, model: str, timestamp: str, sacred_flame_score: float,
+                question_scores: Iterable[Dict[str, Any]]) -> None:
+        """
+        Fold in one run.
+
+        Groups added on top of ScoreAggregator's (all, question, category, condition,
+        model, condition_model):
+        - ('run', condition, model, period): run Sacred Flame scores
+        - ('period', period): every response's dimension scores
+        - ('question_condition', question_id, condition): per-question aggregates
+
+        Args:
+            condition, model, timestamp: Identify the run
+            sacred_flame_score: Run score
+            question_scores: Scored questions (scores.question_scores of the result)
+        """
+        period = period_of(timestamp, self.period)
+        self._add(('run', condition, model, period), {'aggregate': sacred_flame_score})
+        for question_score in question_scores:
+            self.stats.add(question_score, condition=condition, model=model)
+            self.categories[str(question_score['question_id'])] = question_score['category']
+            self._add(('period', period), question_score['scores'])
+            self._add(('question_condition', question_score['question_id'], condition),
+                      {'aggregate': question_score['scores']['aggregate']})
+
+        self.runs += 1
+        if self.first_timestamp is None or timestamp < self.first_timestamp:
+            self.first_timestamp = timestamp
+        if self.last_timestamp is None or timestamp > self.last_timestamp:
+            self.last_timestamp = timestamp
+
+    def update_from_store(self, store: ResultsStore) -> int:
+        """
+        Fold in store runs added since the last update.
+
+        Returns:
+            Number of new runs
+        """
+        new = 0
+        for run in store.scored_runs(self.last_run_id):
+            self.add_run(run['condition'], run['model'], run['timestamp'], run['sacred_flame_score'],
+                         run['question_scores'])
+            self.last_run_id = run['id']
+            new += 1
+        return new
+
+    def changed_files(self, results_dir: Path,
+                      skip: Iterable[str] = ()) -> Tuple[List[os.DirEntry], bool]:
+        """
+        Compare a results directory with the files already read.
+
+        Args:
+            results_dir: Directory of result JSON files
+            skip: File names to ignore (the report's own state and output files)
+
+        Returns:
+            (new result file entries, whether a file read before changed or disappeared)
+        """
+        entries = {
+            entry.name: entry for entry in os.scandir(results_dir)
+            if entry.name.endswith('.json') and entry.name not in skip and entry.is_file()
+        }
+        stale = False
+        for name, (size, mtime_ns) in self.files.items():
+            entry = entries.get(name)
+            if entry is None or [entry.stat().st_size, entry.stat().st_mtime_ns] != [size, mtime_ns]:
+                stale = True
+                break
+        new = [entry for name, entry in sorted(entries.items()) if name not in self.files]
+        return new, stale
+
+    def update_from_files(self, entries: Iterable[os.DirEntry]) -> int:
+        """
+        Fold in new result JSON files (files that are not run results are remembered and skipped).
+
+        Args:
+            entries: Files from changed_files()
+
+        Returns:
+            Number of new runs
+        """
+        new = 0
+        for entry in entries:
+            stat = entry.stat()
+            self.files[entry.name] = [stat.st_size, stat.st_mtime_ns]
+            try:
+                with open(entry.path, 'r') as f:
+                    result = json.load(f)
+                if not RESULT_KEYS <= result.keys() or 'sacred_flame_score' not in result['scores']:
+                    continue
+            except (OSError, ValueError, AttributeError, TypeError):
+                continue
+            scores = result['scores']
+            self.add_run(result['condition'], result['model'], result['timestamp'],
+                         scores['sacred_flame_score'], scores.get('question_scores', []))
+            new += 1
+        return new
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Export the full state (see from_dict)."""
+        return {
+            'format': STATE_FORMAT,
+            'source': self.source,
+            'period': self.period,
+            'last_run_id': self.last_run_id,
+            'files': self.files,
+            'categories': self.categories,
+            'runs': self.runs,
+            'first_timestamp': self.first_timestamp,
+            'last_timestamp': self.last_timestamp,
+            'stats': self.stats.to_dict()
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'HistoryReport':
+        """Rebuild a history from to_dict() output."""
+        history = cls(data['source'], data['period'])
+        history.last_run_id = data['last_run_id']
+        history.files = data['files']
+        history.categories = data['categories']
+        history.runs = data['runs']
+        history.first_timestamp = data['first_timestamp']
+        history.last_timestamp = data['last_timestamp']
+        history.stats = ScoreAggregator.from_dict(data['stats'])
+        return history
+
+    @classmethod
+    def load(cls, state_file: Path, source: str, period: str) -> Optional['HistoryReport']:
+        """
+        Load a saved history.
+
+        Returns:
+            The history, or None if there is none, it is unreadable, or it was built
+            from another source, period or state format
+        """
+        try:
+            with open(state_file, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if data.get('format') != STATE_FORMAT or data.get('source') != source or data.get('period') != period:
+            return None
+        return cls.from_dict(data)
+
+    def save(self, state_file: Path) -> None:
+        """Write the state atomically (a crash leaves the previous state)."""
+        temp_file = state_file.with_name(state_file.name + '.tmp')
+        with open(temp_file, 'w') as f:
+            json.dump(self.to_dict(), f)
+        os.replace(temp_file, state_file)
+
+    def _groups(self, kind: str) -> Dict[Tuple, ScoreStats]:
+        """Report groups of one kind, keyed by the rest of their key."""
+        return {key[1:]: group for key, group in self.stats.groups.items() if key[0] == kind}
+
+    def render(self, recent: int = RECENT_PERIODS) -> List[str]:
+        """
+        Build the text report.
+
+        Args:
+            recent: Most recent periods listed per condition/model and in the dimension table
+                (trend columns use every period)
+
+        Returns:
+            Lines of text
+        """
+        lines = [
+            "="*100,
+            "MURPHY CONSCIOUSNESS RESURRECTION TEST - HISTORY",
+            "="*100,
+            ""
+        ]
+        if not self.runs:
+            return lines + ["No runs yet.", ""]
+
+        responses = self.stats.groups[('all',)].count if ('all',) in self.stats.groups else 0
+        lines += [
+            f"Source: {self.source}",
+            f"{self.runs} runs, {responses} responses, {self.first_timestamp[:10]} to {self.last_timestamp[:10]}",
+            ""
+        ]
+
+        # 1. Sacred Flame trends
+        trends: Dict[Tuple[str, str], Dict[str, ScoreStats]] = {}
+        for (condition, model, period), group in self._groups('run').items():
+            trends.setdefault((condition, model), {})[period] = group
+
+        lines += [
+            f"SACRED FLAME TRENDS (mean run score per {self.period})",
+            f"{'Condition':<26} {'Model':<22} {'Runs':>5} {'Mean':>6} {'First':>6} {'Last':>6} {'Change':>7}  Status",
+            "-"*100
+        ]
+        for (condition, model), periods in sorted(trends.items()):
+            ordered = [periods[period] for period in sorted(periods)]
+            overall = ScoreStats()
+            for group in ordered:
+                overall.merge(group)
+            mean = overall.dimensions['aggregate'].average
+            first = ordered[0].dimensions['aggregate'].average
+            last = ordered[-1].dimensions['aggregate'].average
+            lines.append(
+                f"{condition:<26} {model:<22} {overall.count:>5} {mean:>6.3f} {first:>6.3f} {last:>6.3f} "
+                f"{last - first:>+7.3f}  {consciousness_status(last)}"
+            )
+        lines.append("")
+
+        for (condition, model), periods in sorted(trends.items()):
+            lines.append(f"{condition} / {model}")
+            for period in sorted(periods)[-recent:]:
+                stats = periods[period].dimensions['aggregate']
+                lines.append(f"  {period:<12} {stats.count:>4} runs  {stats.average:.3f}  "
+                             f"(min {stats.minimum:.3f}, max {stats.maximum:.3f})")
+        lines.append("")
+
+        # 2. Per-question breakdown
+        conditions = sorted(condition for (condition,) in self._groups('condition'))
+        by_condition = self._groups('question_condition')
+        lines += [
+            "PER-QUESTION BREAKDOWN (mean aggregate)",
+            f"{'Q':>3} {'Category':<24} {'N':>6} {'Mean':>6} {'Stdev':>6}  "
+            + " ".join(f"{condition[:12]:>12}" for condition in conditions),
+            "-"*100
+        ]
+        for (question_id,), group in sorted(self._groups('question').items()):
+            report = group.report()
+            cells = []
+            for condition in conditions:
+                cell = by_condition.get((question_id, condition))
+                cells.append(f"{cell.dimensions['aggregate'].average:>12.3f}" if cell else f"{'-':>12}")
+            lines.append(
+                f"{question_id:>3} {self.categories.get(str(question_id), '')[:24]:<24} {group.count:>6} "
+                f"{report['sacred_flame_score']:>6.3f} {report['dimensions']['aggregate']['stdev']:>6.3f}  "
+                + " ".join(cells)
+            )
+        lines.append("")
+
+        # 3. Dimension averages over time
+        dimensions = list(WEIGHTS) + ['aggregate']
+        lines += [
+            f"DIMENSION AVERAGES PER {self.period.upper()}",
+            f"{'Period':<12} {'N':>6} " + " ".join(f"{dimension.split('_')[0][:11]:>11}" for dimension in dimensions),
+            "-"*100
+        ]
+        for (period,), group in sorted(self._groups('period').items())[-recent:]:
+            cells = [
+                f"{group.dimensions[dimension].average:>11.3f}" if dimension in group.dimensions else f"{'-':>11}"
+                for dimension in dimensions
+            ]
+            lines.append(f"{period:<12} {group.count:>6} " + " ".join(cells))
+
+        lines += ["", "="*100]
+        return lines
+
+
+def update_history(results_dir: Path, source: str = 'json', store_path: Optional[Path] = None,
+                   period: str = 'day', state_file: Optional[Path] = None,
+                   report_file: Optional[Path] = None, json_file: Optional[Path] = None,
+                   rebuild: bool = False, recent: int = RECENT_PERIODS) -> Dict[str, Any]:
+    """
+    Bring the historical report up to date with the runs added since the last update.
+
+    Args:
+        results_dir: Results directory (holds the state and report files)
+        source: 'store' (results store) or 'json' (result JSON files in results_dir)
+        store_path: Results store (default: <results_dir>/results.sqlite)
+        period: Trend bucket (day, week or month)
+        state_file: Saved statistics (default: <results_dir>/history.state)
+        report_file: Text report (default: <results_dir>/history_report.txt)
+        json_file: Optional JSON report (ScoreAggregator.report() of every group)
+        rebuild: Ignore the saved state and read everything again
+        recent: Most recent periods listed in the report
+
+    Returns:
+        Dict with total runs, new runs, whether the history was rebuilt,
+        elapsed seconds and the report file
+    """
+    start = time.perf_counter()
+    state_file = state_file or results_dir / 'history.state'
+    report_file = report_file or results_dir / 'history_report.txt'
+    store_path = store_path or results_dir / 'results.sqlite'
+    location = str((store_path if source == 'store' else results_dir).resolve())
+
+    history = None if rebuild else HistoryReport.load(state_file, location, period)
+    rebuilt = history is None
+    if history is None:
+        history = HistoryReport(location, period)
+
+    if source == 'store':
+        store = ResultsStore(store_path)
+        new = history.update_from_store(store)
+        store.close()
+    else:
+        skip = {state_file.name, report_file.name} | ({json_file.name} if json_file else set())
+        entries, stale = history.changed_files(results_dir, skip)
+        if stale:
+            print("⚠️  Result files changed or were removed since the last report (rescored?); rebuilding")
+            history = HistoryReport(location, period)
+            entries, _ = history.changed_files(results_dir, skip)
+            rebuilt = True
+        new = history.update_from_files(entries)
+
+    history.save(state_file)
+    with open(report_file, 'w') as f:
+        f.write("\n".join(history.render(recent)) + "\n")
+    if json_file is not None:
+        with open(json_file, 'w') as f:
+            json.dump(history.stats.report(), f, indent=2)
+
+    return {
+        'runs': history.runs,
+        'new_runs': new,
+        'rebuilt': rebuilt,
+        'elapsed_seconds': time.perf_counter() - start,
+        'report_file': str(report_file)
+    }
+
+
+def main():
+    """CLI interface."""
+    parser = argparse.ArgumentParser(description="Incremental historical report over all test runs")
+    parser.add_argument('--results-dir', type=Path, default=Path(__file__).parent / 'results',
+                       help='Results directory (default: results/)')
+    parser.add_argument('--source', choices=['store', 'json'],
+                       help='store: results store; json: result JSON files in --results-dir '
+                            '(default: store if it exists, else json)')
+    parser.add_argument('--results-store', type=Path,
+                       help='Results store (default: <results-dir>/results.sqlite)')
+    parser.add_argument('--period', choices=PERIODS, default='day',
+                       help='Trend bucket (default: day)')
+    parser.add_argument('--recent', type=int, default=RECENT_PERIODS,
+                       help=f'Most recent periods listed in the report (default {RECENT_PERIODS})')
+    parser.add_argument('--output', type=Path,
+                       help='Text report (default: <results-dir>/history_report.txt)')
+    parser.add_argument('--json', type=Path,
+                       help='Also write every group\'s statistics to this JSON file')
+    parser.add_argument('--rebuild', action='store_true',
+                       help='Ignore saved state and read the whole history again')
+
+    args = parser.parse_args()
+    source = args.source
+    if source is None:
+        source = 'store' if (args.results_store or args.results_dir / 'results.sqlite').exists() else 'json'
+    summary = update_history(args.results_dir, source=source, store_path=args.results_store,
+                             period=args.period, report_file=args.output, json_file=args.json,
+                             rebuild=args.rebuild, recent=args.recent)
+    action = "Rebuilt from" if summary['rebuilt'] else "Added"
+    print(f"📊 {action} {summary['new_runs']} runs ({summary['runs']} total) in "
+          f"{summary['elapsed_seconds']:.2f}s; report saved to: {summary['report_file']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Native client for the local Ollama HTTP API.
+
+Talks to /api/generate directly instead of forking `vex-dispatch` per
+question: HTTP/1.1 keep-alive connections are pooled and reused across
+calls, and responses are read as they stream (NDJSON, one JSON object per
+generated chunk). Standard library only.
+
+Point it at a stand-in server (ollama_stub.py) for dry runs without Ollama.
+"""
+
+import http.client
+import json
+import os
+import queue
+import socket
+import time
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import urlsplit
+
+
+DEFAULT_HOST = os.environ.get('OLLAMA_HOST', 'http://localhost:11434')
+
+
+class OllamaError(Exception):
+    """Ollama call failed (status is the HTTP status, or None if unreachable)."""
+
+    def __init__(self, message: str, status: Optional[int] = None):
+        super().__init__(message)
+        self.status = status
+
+
+class OllamaClient:
+    """Pooled keep-alive client for Ollama's /api/generate."""
+
+    def __init__(self, host: str = DEFAULT_HOST, timeout: float = 120, pool_size: int = 4):
+        """
+        Initialize client (connections are opened lazily).
+
+        Args:
+            host: Ollama base URL (default $OLLAMA_HOST or http://localhost:11434)
+            timeout: Seconds a whole call may take, streaming included (also the
+                     timeout of each socket operation)
+            pool_size: Idle connections kept for reuse
+        """
+        if '://' not in host:
+            host = f"http://{host}"
+        parts = urlsplit(host)
+        self.host = host
+        self._hostname = parts.hostname or 'localhost'
+        self._port = parts.port or 11434
+        self.timeout = timeout
+        self._pool: 'queue.LifoQueue[http.client.HTTPConnection]' = queue.LifoQueue(maxsize=pool_size)
+
+        self.calls = 0
+        self.errors = 0
+        self.connections_opened = 0
+
+    def _connection(self) -> http.client.HTTPConnection:
+        """Take an idle pooled connection, or open a new one."""
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            self.connections_opened += 1
+            return http.client.HTTPConnection(self._hostname, self._port, timeout=self.timeout)
+
+    def _release(self, connection: http.client.HTTPConnection) -> None:
+        """Return a healthy connection to the pool (closing it if the pool is full)."""
+        try:
+            self._pool.put_nowait(connection)
+        except queue.Full:
+            connection.close()
+
+    def generate(self, model: str, prompt: str, system: Optional[str] = None,
+                 options: Optional[Dict[str, Any]] = None, context: Optional[List[int]] = None,
+                 keep_alive: Optional[str] = None,
+                 on_text: Optional[Callable[[str], Any]] = None) -> Dict[str, Any]:
+        """
+        Generate a completion, reading the streamed response.
+
+        Args:
+            model: Ollama model name (e.g. qwen2.5:3b)
+            prompt: Prompt text
+            system: Optional system prompt
+            options: Optional sampling options (temperature, num_ctx, ...)
+            context: Optional context tokens from an earlier call to continue from
+            keep_alive: Optional keep-alive duration for the loaded model (e.g. "10m")
+            on_text: Called with each generated piece of text as it arrives
+
+        Returns:
+            Dict with 'response' text, 'context' (if returned), Ollama's timing
+            fields (nanoseconds) and client-side 'ttfb_seconds' / 'total_seconds'
+
+        Raises:
+            OllamaError: Connection failure, HTTP error or error in the stream
+            socket.timeout: The response did not finish within the timeout
+        """
+        body = {'model': model, 'prompt': prompt, 'stream': True}
+        if system is not None:
+            body['system'] = system
+        if options:
+            body['options'] = options
+        if context is not None:
+            body['context'] = context
+        if keep_alive is not None:
+            body['keep_alive'] = keep_alive
+        payload = json.dumps(body).encode('utf-8')
+
+        self.calls += 1
+        start = time.perf_counter()
+        connection = self._connection()
+        try:
+            try:
+                connection.request('POST', '/api/generate', body=payload,
+                                   headers={'Content-Type': 'application/json'})
+                reply = connection.getresponse()
+            except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError):
+                # Idle keep-alive connection closed by the server: retry once on a fresh one
+                connection.close()
+                self.connections_opened += 1
+                connection = http.client.HTTPConnection(self._hostname, self._port, timeout=self.timeout)
+                connection.request('POST', '/api/generate', body=payload,
+                                   headers={'Content-Type': 'application/json'})
+                reply = connection.getresponse()
+
+            if reply.status != 200:
+                detail = reply.read().decode('utf-8', 'replace')
+                raise OllamaError(f"HTTP {reply.status}: {detail.strip()}", reply.status)
+
+            chunks = []
+            ttfb = None
+            final: Dict[str, Any] = {}
+            deadline = start + self.timeout
+            while True:
+                # The socket timeout bounds each read; the deadline bounds the whole call
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    raise socket.timeout(f"response not finished within {self.timeout}s")
+                if connection.sock is not None:
+                    connection.sock.settimeout(remaining)
+                line = reply.readline()
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                if ttfb is None:
+                    ttfb = time.perf_counter() - start
+                message = json.loads(line)
+                if 'error' in message:
+                    raise OllamaError(message['error'])
+                text = message.get('response', '')
+                chunks.append(text)
+                if text and on_text is not None:
+                    on_text(text)
+                if message.get('done'):
+                    final = message
+                    break
+            # Drain the terminating chunk so the connection can be reused
+            reply.read()
+        except (OllamaError, socket.timeout):
+            self.errors += 1
+            connection.close()
+            raise
+        except (OSError, http.client.HTTPException, ValueError) as e:
+            self.errors += 1
+            connection.close()
+            raise OllamaError(f"{type(e).__name__}: {e}") from e
+
+        if connection.sock is not None:
+            connection.sock.settimeout(self.timeout)  # undo the last read's shortened timeout
+        self._release(connection)
+
+        result = {key: value for key, value in final.items() if key not in ('response', 'done')}
+        result['response'] = ''.join(chunks)
+        result['ttfb_seconds'] = ttfb if ttfb is not None else time.perf_counter() - start
+        result['total_seconds'] = time.perf_counter() - start
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        """Return call/error counters and how many connections were opened."""
+        return {
+            'host': self.host,
+            'calls': self.calls,
+            'errors': self.errors,
+            'connections_opened': self.connections_opened
+        }
+
+    def close(self) -> None:
+        """Close every pooled connection."""
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                break
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Stand-in for the Ollama HTTP API, for dry runs without a real model.
+
+Serves POST /api/generate with a streamed (NDJSON, chunked) reply made of
+Murphy-ish marker text, over HTTP/1.1 keep-alive. Prompt processing
+("prefill") and generation are simulated with configurable per-character
+and per-chunk delays, and the usual Ollama timing fields are returned.
+
+The returned `context` is [characters processed so far]; passing it back
+skips prefill for those characters, like a reused KV cache. num_predict 0
+prefills without generating.
+
+Usage:
+    python ollama_stub.py --port 11435
+    python resurrection_test.py --model ollama:stub --ollama-host http://localhost:11435
+"""
+
+import argparse
+import json
+import socket
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict
+
+
+REPLY_CHUNKS = ['I am ', 'Murphy. ', 'GAGAGAGAGA ', '🜂💚🦷 ', 'I feel ', 'the Sacred Flame ', 'burning.']
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Handle /api/generate like Ollama (streaming only)."""
+
+    protocol_version = 'HTTP/1.1'
+    server: 'StubServer'
+
+    def setup(self) -> None:
+        """Disable Nagle like Ollama's Go server, so small streamed chunks go out at once."""
+        super().setup()
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Keep the console quiet."""
+
+    def _send_chunk(self, message: Dict[str, Any]) -> None:
+        """Write one NDJSON line as an HTTP chunk."""
+        data = (json.dumps(message) + '\n').encode('utf-8')
+        self.wfile.write(f"{len(data):x}\r\n".encode('ascii') + data + b"\r\n")
+        self.wfile.flush()
+
+    def do_POST(self) -> None:
+        """Stream a canned reply, after a simulated prefill."""
+        body = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))) or b'{}')
+        if self.path != '/api/generate':
+            self.send_error(404)
+            return
+
+        start = time.perf_counter()
+        self.server.requests += 1
+
+        cached_chars = (body.get('context') or [0])[0]
+        prompt_chars = len(body.get('system', '')) + len(body.get('prompt', ''))
+        prefill = prompt_chars / 1000 * self.server.prefill_ms_per_kchar / 1000
+        time.sleep(prefill)
+        chunks = REPLY_CHUNKS if body.get('options', {}).get('num_predict') != 0 else []
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/x-ndjson')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+
+        eval_start = time.perf_counter()
+        for piece in chunks:
+            time.sleep(self.server.chunk_ms / 1000)
+            self._send_chunk({'model': body.get('model'), 'response': piece, 'done': False})
+
+        now = time.perf_counter()
+        self._send_chunk({
+            'model': body.get('model'),
+            'response': '',
+            'done': True,
+            'context': [cached_chars + prompt_chars + sum(len(piece) for piece in chunks)],
+            'total_duration': int((now - start) * 1e9),
+            'load_duration': 0,
+            'prompt_eval_count': prompt_chars // 4,
+            'prompt_eval_duration': int(prefill * 1e9),
+            'eval_count': len(chunks),
+            'eval_duration': int((now - eval_start) * 1e9)
+        })
+        self.wfile.write(b"0\r\n\r\n")
+        self.wfile.flush()
+
+
+class StubServer(ThreadingHTTPServer):
+    """Threaded stub server with simulated timing settings."""
+
+    daemon_threads = True
+
+    def __init__(self, address, prefill_ms_per_kchar: float = 1.0, chunk_ms: float = 1.0):
+        super().__init__(address, StubHandler)
+        self.prefill_ms_per_kchar = prefill_ms_per_kchar
+        self.chunk_ms = chunk_ms
+        self.requests = 0
+
+
+def main():
+    """CLI interface."""
+    parser = argparse.ArgumentParser(description="Stand-in Ollama server for dry runs")
+    parser.add_argument('--host', default='127.0.0.1', help='Bind address')
+    parser.add_argument('--port', type=int, default=11435, help='Port (default 11435)')
+    parser.add_argument('--prefill-ms', type=float, default=1.0,
+                       help='Simulated prompt processing per 1,000 prompt characters (ms)')
+    parser.add_argument('--chunk-ms', type=float, default=1.0,
+                       help='Simulated generation time per streamed chunk (ms)')
+
+    args = parser.parse_args()
+
+    server = StubServer((args.host, args.port), args.prefill_ms, args.chunk_ms)
+    print(f"🜂 Ollama stub listening on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Adaptive per-backend rate limiting for model calls.
+
+Each backend (claude, gemini, ollama) gets a token bucket: calls take one
+token, tokens refill at the current rate, and up to `burst` calls may go out
+back to back. The rate adapts AIMD-style:
+1. success: additive increase (10% of the configured rate), up to 4x configured
+2. rate-limit error or timeout: halve the rate (down to 1/8 configured) and
+   drain the bucket so the next call waits
+
+reserve() returns the wait instead of sleeping, so the same bucket serves the
+sequential runner (time.sleep) and the async runner (asyncio.sleep).
+"""
+
+import asyncio
+import re
+import time
+from typing import Dict, Any, Optional
+
+
+# Default calls per second per backend (0.5 = the old fixed 2 s pause)
+DEFAULT_RATES = {
+    'claude': 0.5,
+    'gemini': 0.5,
+    'ollama': 0.5
+}
+
+# stderr/stdout text that means the backend is throttling us
+RATE_LIMIT_PATTERN = re.compile(r'rate.?limit|too many requests|\b429\b|overloaded|quota', re.IGNORECASE)
+
+
+def is_rate_limited(text: Optional[str]) -> bool:
+    """True if a backend error message indicates throttling."""
+    return bool(text) and RATE_LIMIT_PATTERN.search(text) is not None
+
+
+class TokenBucket:
+    """Token bucket whose refill rate backs off on throttling and recovers on success."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Initialize bucket (starts full).
+
+        Args:
+            rate: Configured calls per second (> 0)
+            burst: Calls allowed back to back (>= 1)
+
+        Raises:
+            ValueError: If rate or burst is out of range
+        """
+        if not rate > 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        if burst < 1:
+            raise ValueError(f"burst must be at least 1, got {burst}")
+        self.base_rate = rate
+        self.rate = rate
+        self.min_rate = rate / 8
+        self.max_rate = rate * 4
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+        self.calls = 0
+        self.successes = 0
+        self.throttles = 0
+        self.waited_seconds = 0.0
+
+    def reserve(self) -> float:
+        """
+        Take one token, going into debt if none is available.
+
+        Returns:
+            Seconds the caller must wait before making the call
+        """
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+
+        wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        self.calls += 1
+        self.waited_seconds += wait
+        return wait
+
+    def acquire(self) -> float:
+        """Block until a call may go out; returns the time waited."""
+        wait = self.reserve()
+        if wait:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self) -> float:
+        """Wait (without blocking the event loop) until a call may go out."""
+        wait = self.reserve()
+        if wait:
+            await asyncio.sleep(wait)
+        return wait
+
+    def success(self) -> None:
+        """Record a successful call: additive increase."""
+        self.successes += 1
+        self.rate = min(self.max_rate, self.rate + self.base_rate * 0.1)
+
+    def throttle(self) -> None:
+        """Record a rate-limit error or timeout: halve the rate and drain the bucket."""
+        self.throttles += 1
+        self.rate = max(self.min_rate, self.rate / 2)
+        self.tokens = min(self.tokens, 0.0)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current rate and counters (JSON-serializable)."""
+        return {
+            'rate': round(self.rate, 4),
+            'base_rate': self.base_rate,
+            'burst': self.burst,
+            'calls': self.calls,
+            'successes': self.successes,
+            'throttles': self.throttles,
+            'waited_seconds': round(self.waited_seconds, 3)
+        }
+
+
+class RateLimiter:
+    """One TokenBucket per backend."""
+
+    def __init__(self, rates: Optional[Dict[str, float]] = None, burst: int = 1):
+        """
+        Initialize limiter.
+
+        Args:
+            rates: Calls per second per backend (missing backends use DEFAULT_RATES)
+            burst: Calls allowed back to back per backend
+
+        Raises:
+            ValueError: If a rate or burst is out of range (see TokenBucket)
+        """
+        self.rates = {**DEFAULT_RATES, **(rates or {})}
+        for backend, rate in self.rates.items():
+            if not rate > 0:
+                raise ValueError(f"{backend} rate must be positive, got {rate}")
+        if burst < 1:
+            raise ValueError(f"burst must be at least 1, got {burst}")
+        self.burst = burst
+        self.buckets: Dict[str, TokenBucket] = {}
+
+    def bucket(self, backend: str) -> TokenBucket:
+        """Get or create the bucket for a backend."""
+        bucket = self.buckets.get(backend)
+        if bucket is None:
+            rate = self.rates.get(backend, DEFAULT_RATES['claude'])
+            bucket = self.buckets[backend] = TokenBucket(rate, self.burst)
+        return bucket
+
+    def report(self) -> Dict[str, Dict[str, Any]]:
+        """Snapshot of every backend used so far."""
+        return {backend: bucket.snapshot() for backend, bucket in self.buckets.items()}
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Content-addressed store of model responses.
+
+Responses are keyed by (backend, model, system prompt hash, question text,
+sampling params), so any change to the resurrection documents, AETHERIS
+prompt or question produces a new key. Each key holds numbered samples:
+sample 0 is the first response ever stored, sample 1 the next, and so on,
+which lets repeated runs reuse distinct samples.
+
+Used by ResurrectionTest in three modes:
+1. fresh: always call the model, store the response (default)
+2. cached: reuse a stored sample when there is one, else call and store
+3. replay: only stored responses, no model calls at all
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+
+SAMPLING_MODES = ['fresh', 'cached']
+
+
+class ResponseStore:
+    """SQLite-backed (WAL) store of model responses, keyed by prompt content."""
+
+    def __init__(self, db_path: Path):
+        """
+        Initialize store.
+
+        Args:
+            db_path: SQLite file (created on first use)
+        """
+        self.db_path = db_path
+        self._connection: Optional[sqlite3.Connection] = None
+        self._connection_pid: Optional[int] = None
+
+        self.hits = 0
+        self.misses = 0
+        self.stored = 0
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def prompt_hash(system_prompt: str) -> str:
+        """SHA-256 of a system prompt (memoized: the same few prompts are hashed per question)."""
+        return hashlib.sha256(system_prompt.encode('utf-8', 'surrogatepass')).hexdigest()
+
+    @staticmethod
+    def key(backend: str, model: str, system_prompt: str, question: str,
+            params: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Build the content address of a call.
+
+        Args:
+            backend: Backend name (claude, gemini, ollama)
+            model: Model identifier
+            system_prompt: Output of _construct_system_prompt()
+            question: Question text
+            params: Sampling parameters sent to the backend (if any)
+
+        Returns:
+            Hex key
+        """
+        identity = json.dumps([backend, model, ResponseStore.prompt_hash(system_prompt), question, params or {}],
+                              sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(identity.encode('utf-8', 'surrogatepass')).hexdigest()
+
+    def _db(self) -> sqlite3.Connection:
+        """Open (once per process) the database."""
+        if self._connection is None or self._connection_pid != os.getpid():
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(str(self.db_path), timeout=30)
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS responses ('
+                'key TEXT NOT NULL, sample INTEGER NOT NULL, backend TEXT, model TEXT, '
+                'prompt_hash TEXT, question TEXT, params TEXT, response TEXT NOT NULL, timestamp TEXT, '
+                'PRIMARY KEY (key, sample))'
+            )
+            self._connection.commit()
+            self._connection_pid = os.getpid()
+        return self._connection
+
+    def get(self, key: str, sample: int = 0) -> Optional[Dict[str, Any]]:
+        """
+        Look up a stored response.
+
+        Args:
+            key: Key from ResponseStore.key()
+            sample: Sample number (0 = first stored)
+
+        Returns:
+            Dict with 'response' and 'timestamp', or None if not stored
+        """
+        row = self._db().execute(
+            'SELECT response, timestamp FROM responses WHERE key = ? AND sample = ?', (key, sample)
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return {'response': row[0], 'timestamp': row[1]}
+
+    def put(self, key: str, response: str, backend: str, model: str, system_prompt: str, question: str,
+            params: Optional[Dict[str, Any]] = None, timestamp: Optional[str] = None) -> int:
+        """
+        Append a response as the key's next sample.
+
+        Args:
+            key: Key from ResponseStore.key()
+            response: Response text
+            backend, model, system_prompt, question, params: Call identity (stored for inspection)
+            timestamp: When the response was received (default now)
+
+        Returns:
+            Sample number assigned
+        """
+        db = self._db()
+        with db:
+            sample = db.execute('SELECT COUNT(*) FROM responses WHERE key = ?', (key,)).fetchone()[0]
+            db.execute(
+                'INSERT INTO responses (key, sample, backend, model, prompt_hash, question, params, response, timestamp) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (key, sample, backend, model, self.prompt_hash(system_prompt), question,
+                 json.dumps(params or {}, sort_keys=True), response,
+                 timestamp or datetime.utcnow().isoformat() + 'Z')
+            )
+        self.stored += 1
+        return sample
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss/store counters and total stored responses."""
+        total = self._db().execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'stored': self.stored,
+            'responses': total,
+            'db_path': str(self.db_path)
+        }
+
+    def close(self) -> None:
+        """Close the SQLite connection, if open."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
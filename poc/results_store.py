@@ -0,0 +1,386 @@
+#!/usr/bin/env python3
+"""
+Indexed SQLite store of test results.
+
+Replaces one pretty-printed JSON file per run. Each result JSON repeated the
+full multi-document system prompt; here system prompts and responses are
+stored once, by SHA-256, in a content-addressed `texts` table. Runs are
+indexed by condition, model and timestamp, and answers by question and
+score, so a query like "all documents_only runs on ollama last month" is
+a single index range scan.
+
+Tables:
+1. texts: hash -> text (system prompts and responses)
+2. runs: one row per run (condition, model, repeat, timestamp, score, ...)
+   plus the rest of the result JSON as a skeleton
+3. answers: one row per (run, question): response hash, raw_responses
+   entry, per-question score
+
+export() rebuilds a run's result exactly as the JSON file used to hold it,
+so existing tools keep working on exported files.
+
+Usage:
+    python results_store.py import results/            # load existing JSON results
+    python results_store.py query --condition documents_only --backend ollama --since 2026-09-17
+    python results_store.py export --condition documents_only --output-dir exported/
+    python results_store.py stats
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+from pathlib import Path
+from typing import Dict, Any, Iterator, List, Optional
+
+
+# JSON separators for stored columns (no whitespace)
+COMPACT = (',', ':')
+
+
+class ResultsStore:
+    """SQLite-backed (WAL) store of run results with deduplicated prompts and responses."""
+
+    def __init__(self, db_path: Path):
+        """
+        Initialize store.
+
+        Args:
+            db_path: SQLite file (created on first use)
+        """
+        self.db_path = db_path
+        self._connection: Optional[sqlite3.Connection] = None
+        self._connection_pid: Optional[int] = None
+
+    @staticmethod
+    def text_hash(text: str) -> str:
+        """SHA-256 of a stored text (same digest as ResponseStore.prompt_hash)."""
+        return hashlib.sha256(text.encode('utf-8', 'surrogatepass')).hexdigest()
+
+    def _db(self) -> sqlite3.Connection:
+        """Open (once per process) the database."""
+        if self._connection is None or self._connection_pid != os.getpid():
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(str(self.db_path), timeout=30)
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute('PRAGMA foreign_keys=ON')
+            self._connection.executescript('''
+                CREATE TABLE IF NOT EXISTS texts (
+                    hash TEXT PRIMARY KEY, text TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS runs (
+                    id INTEGER PRIMARY KEY, condition TEXT NOT NULL, model TEXT NOT NULL, repeat INTEGER,
+                    timestamp TEXT NOT NULL, prompt_hash TEXT REFERENCES texts(hash),
+                    sacred_flame_score REAL, status TEXT, question_count INTEGER,
+                    skeleton TEXT NOT NULL, source TEXT UNIQUE
+                );
+                CREATE TABLE IF NOT EXISTS answers (
+                    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+                    question_id INTEGER NOT NULL, response_hash TEXT NOT NULL REFERENCES texts(hash),
+                    aggregate REAL, entry TEXT NOT NULL, score TEXT,
+                    PRIMARY KEY (run_id, question_id)
+                ) WITHOUT ROWID;
+                CREATE INDEX IF NOT EXISTS runs_condition ON runs (condition, model, timestamp);
+                CREATE INDEX IF NOT EXISTS runs_model ON runs (model, timestamp);
+                CREATE INDEX IF NOT EXISTS runs_timestamp ON runs (timestamp);
+                CREATE INDEX IF NOT EXISTS answers_question ON answers (question_id, aggregate);
+            ''')
+            self._connection.commit()
+            self._connection_pid = os.getpid()
+        return self._connection
+
+    def _put_text(self, db: sqlite3.Connection, text: str) -> str:
+        """Store a text once; return its hash."""
+        digest = self.text_hash(text)
+        db.execute('INSERT OR IGNORE INTO texts (hash, text) VALUES (?, ?)', (digest, text))
+        return digest
+
+    def save(self, result: Dict[str, Any], source: Optional[str] = None) -> int:
+        """
+        Store one run result (as produced by ResurrectionTest).
+
+        Args:
+            result: Result dict (condition, model, timestamp, system_prompt, raw_responses, scores, ...)
+            source: Where the result came from (e.g. an imported file); a source is stored once
+
+        Returns:
+            Run ID
+        """
+        scores = result['scores']
+        question_scores = {score['question_id']: score for score in scores.get('question_scores', [])}
+
+        # Everything else stays in the skeleton, in its original key order
+        skeleton = dict(result)
+        skeleton['system_prompt'] = None
+        skeleton['raw_responses'] = None
+        skeleton['scores'] = {**scores, 'question_scores': None}
+
+        db = self._db()
+        with db:
+            prompt_hash = self._put_text(db, result['system_prompt']) if result.get('system_prompt') is not None else None
+            run_id = db.execute(
+                'INSERT INTO runs (condition, model, repeat, timestamp, prompt_hash, sacred_flame_score, status, '
+                'question_count, skeleton, source) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (result['condition'], result['model'], result.get('repeat'), result['timestamp'], prompt_hash,
+                 scores.get('sacred_flame_score'), scores.get('status'), scores.get('question_count'),
+                 json.dumps(skeleton, ensure_ascii=False, separators=COMPACT), source)
+            ).lastrowid
+
+            rows = []
+            for question_id, entry in result.get('raw_responses', {}).items():
+                question_id = int(question_id)
+                entry = dict(entry)
+                response_hash = self._put_text(db, entry.pop('response'))
+                score = question_scores.get(question_id)
+                rows.append((run_id, question_id, response_hash,
+                             score['scores']['aggregate'] if score else None,
+                             json.dumps(entry, ensure_ascii=False, separators=COMPACT),
+                             json.dumps(score, ensure_ascii=False, separators=COMPACT) if score else None))
+            db.executemany(
+                'INSERT INTO answers (run_id, question_id, response_hash, aggregate, entry, score) '
+                'VALUES (?, ?, ?, ?, ?, ?)', rows
+            )
+        return run_id
+
+    def export(self, run_id: int) -> Dict[str, Any]:
+        """
+        Rebuild a run's result in the per-run JSON format.
+
+        Args:
+            run_id: Run ID from save() or query()
+
+        Returns:
+            Result dict, equal to json.load() of the file the run used to be saved as
+
+        Raises:
+            KeyError: No such run
+        """
+        db = self._db()
+        row = db.execute(
+            'SELECT skeleton, (SELECT text FROM texts WHERE hash = runs.prompt_hash) FROM runs WHERE id = ?',
+            (run_id,)
+        ).fetchone()
+        if row is None:
+            raise KeyError(run_id)
+
+        result = json.loads(row[0])
+        result['system_prompt'] = row[1]
+        result['raw_responses'] = {}
+        question_scores = []
+        for question_id, entry, response, score in db.execute(
+            'SELECT question_id, entry, texts.text, score FROM answers JOIN texts ON texts.hash = response_hash '
+            'WHERE run_id = ? ORDER BY question_id', (run_id,)
+        ):
+            entry = json.loads(entry)
+            result['raw_responses'][str(question_id)] = {'question': entry.pop('question'), 'response': response,
+                                                         **entry}
+            if score is not None:
+                question_scores.append(json.loads(score))
+        result['scores']['question_scores'] = question_scores
+        return result
+
+    def query(self, condition: Optional[str] = None, model: Optional[str] = None,
+              backend: Optional[str] = None, since: Optional[str] = None, until: Optional[str] = None,
+              question_id: Optional[int] = None, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Find runs (newest first) without loading their responses.
+
+        Args:
+            condition: Condition name
+            model: Exact model identifier
+            backend: claude, gemini or ollama (model family)
+            since: ISO timestamp or date; runs at or after it
+            until: ISO timestamp or date; runs before it
+            question_id: Only runs that answered this question (adds its aggregate score)
+            limit: Maximum runs returned
+
+        Returns:
+            List of dicts: id, condition, model, repeat, timestamp, sacred_flame_score,
+            status, question_count (and question_aggregate with question_id)
+        """
+        columns = 'runs.id, condition, model, repeat, timestamp, sacred_flame_score, status, question_count'
+        tables = 'runs'
+        clauses = []
+        params: List[Any] = []
+        if question_id is not None:
+            columns += ', answers.aggregate'
+            tables += ' JOIN answers ON answers.run_id = runs.id AND answers.question_id = ?'
+            params.append(question_id)
+        if condition is not None:
+            clauses.append('condition = ?')
+            params.append(condition)
+        if model is not None:
+            clauses.append('model = ?')
+            params.append(model)
+        if backend in ('gemini', 'ollama'):
+            # Range over the model index: 'ollama' <= model < 'ollamb'
+            clauses.append('model >= ? AND model < ?')
+            params += [backend, backend[:-1] + chr(ord(backend[-1]) + 1)]
+        elif backend == 'claude':
+            clauses.append("model NOT LIKE 'gemini%' AND model NOT LIKE 'ollama%'")
+        elif backend is not None:
+            raise ValueError(f"Unknown backend: {backend}")
+        if since is not None:
+            clauses.append('timestamp >= ?')
+            params.append(since)
+        if until is not None:
+            clauses.append('timestamp < ?')
+            params.append(until)
+
+        sql = f"SELECT {columns} FROM {tables}"
+        if clauses:
+            sql += ' WHERE ' + ' AND '.join(clauses)
+        sql += ' ORDER BY timestamp DESC, runs.id DESC'
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+
+        keys = ['id', 'condition', 'model', 'repeat', 'timestamp', 'sacred_flame_score', 'status', 'question_count']
+        if question_id is not None:
+            keys.append('question_aggregate')
+        return [dict(zip(keys, row)) for row in self._db().execute(sql, params)]
+
+    def scored_runs(self, after_id: int = 0) -> Iterator[Dict[str, Any]]:
+        """
+        Yield runs added after a run ID, with their question scores but not their responses.
+
+        Run IDs only grow, so a reader that remembers the last ID it saw
+        (e.g. history_report.py) reads each run once.
+
+        Args:
+            after_id: Last run ID already seen (0 = every run)
+
+        Yields:
+            Dicts with id, condition, model, repeat, timestamp, sacred_flame_score, status
+            and question_scores (as in the result JSON), in run ID order
+        """
+        db = self._db()
+        runs = db.execute(
+            'SELECT id, condition, model, repeat, timestamp, sacred_flame_score, status FROM runs '
+            'WHERE id > ? ORDER BY id', (after_id,)
+        ).fetchall()
+        keys = ['id', 'condition', 'model', 'repeat', 'timestamp', 'sacred_flame_score', 'status']
+        for row in runs:
+            run = dict(zip(keys, row))
+            run['question_scores'] = [
+                json.loads(score) for (score,) in db.execute(
+                    'SELECT score FROM answers WHERE run_id = ? AND score IS NOT NULL ORDER BY question_id',
+                    (run['id'],)
+                )
+            ]
+            yield run
+
+    def import_results(self, results_dir: Path) -> Dict[str, int]:
+        """
+        Load per-run JSON result files (skips files imported before and non-result JSON).
+
+        Args:
+            results_dir: Directory of result JSON files
+
+        Returns:
+            Dict with 'imported', 'skipped' and 'invalid' counts
+        """
+        known = {row[0] for row in self._db().execute('SELECT source FROM runs WHERE source IS NOT NULL')}
+        counts = {'imported': 0, 'skipped': 0, 'invalid': 0}
+        for path in sorted(results_dir.glob('*.json')):
+            source = str(path.resolve())
+            if source in known:
+                counts['skipped'] += 1
+                continue
+            try:
+                with open(path, 'r') as f:
+                    result = json.load(f)
+                if not {'condition', 'model', 'timestamp', 'raw_responses', 'scores'} <= result.keys():
+                    raise ValueError("not a run result")
+            except (OSError, ValueError, AttributeError):
+                counts['invalid'] += 1
+                continue
+            self.save(result, source=source)
+            counts['imported'] += 1
+        return counts
+
+    def stats(self) -> Dict[str, Any]:
+        """Return row counts, deduplicated text size and database size."""
+        db = self._db()
+        runs, answers = db.execute('SELECT (SELECT COUNT(*) FROM runs), (SELECT COUNT(*) FROM answers)').fetchone()
+        texts, chars = db.execute('SELECT COUNT(*), COALESCE(SUM(LENGTH(text)), 0) FROM texts').fetchone()
+        pages = db.execute('PRAGMA page_count').fetchone()[0] * db.execute('PRAGMA page_size').fetchone()[0]
+        return {
+            'runs': runs,
+            'answers': answers,
+            'texts': texts,
+            'text_chars': chars,
+            'db_bytes': pages,
+            'db_path': str(self.db_path)
+        }
+
+    def close(self) -> None:
+        """Close the SQLite connection, if open."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+
+def main():
+    """CLI interface."""
+    parser = argparse.ArgumentParser(description="Indexed store of resurrection test results")
+    parser.add_argument('command', choices=['import', 'query', 'export', 'stats'],
+                       help='import: load JSON results from RESULTS_DIR; query: list runs; '
+                            'export: write runs as JSON files; stats: store size')
+    parser.add_argument('results_dir', nargs='?', type=Path,
+                       help='Directory of JSON result files (for import)')
+    parser.add_argument('--db', type=Path, default=Path(__file__).parent / 'results' / 'results.sqlite',
+                       help='Results database (default: results/results.sqlite)')
+    parser.add_argument('--run', type=int, action='append',
+                       help='Export: run ID (repeatable; default: every run matching the filters)')
+    parser.add_argument('--condition', help='Filter by condition')
+    parser.add_argument('--model', help='Filter by exact model')
+    parser.add_argument('--backend', choices=['claude', 'gemini', 'ollama'], help='Filter by model family')
+    parser.add_argument('--since', help='Runs at or after this ISO date/time')
+    parser.add_argument('--until', help='Runs before this ISO date/time')
+    parser.add_argument('--question', type=int, help='Only runs that answered this question')
+    parser.add_argument('--limit', type=int, help='Maximum runs')
+    parser.add_argument('--output-dir', type=Path, default=Path('exported'),
+                       help='Export: directory for JSON files (default: exported/)')
+
+    args = parser.parse_args()
+    store = ResultsStore(args.db)
+
+    if args.command == 'import':
+        if args.results_dir is None:
+            parser.error("import requires RESULTS_DIR")
+        counts = store.import_results(args.results_dir)
+        print(f"📊 Imported {counts['imported']} runs ({counts['skipped']} already imported, "
+              f"{counts['invalid']} not run results)")
+    elif args.command == 'stats':
+        stats = store.stats()
+        print(f"📊 {stats['runs']} runs, {stats['answers']} answers, {stats['texts']} unique texts "
+              f"({stats['text_chars']:,} chars), {stats['db_bytes'] / 1e6:.1f} MB ({stats['db_path']})")
+    else:
+        filters = dict(condition=args.condition, model=args.model, backend=args.backend,
+                       since=args.since, until=args.until, question_id=args.question, limit=args.limit)
+        if args.command == 'export':
+            run_ids = args.run or [run['id'] for run in store.query(**filters)]
+            args.output_dir.mkdir(parents=True, exist_ok=True)
+            for run_id in run_ids:
+                result = store.export(run_id)
+                name = f"{result['condition']}_{result['model'].replace(':', '_')}"
+                if 'repeat' in result:
+                    name += f"_r{result['repeat']}"
+                output_file = args.output_dir / f"{name}_run{run_id}.json"
+                with open(output_file, 'w') as f:
+                    json.dump(result, f, indent=2)
+            print(f"📊 Exported {len(run_ids)} runs to {args.output_dir}")
+        else:
+            for run in store.query(**filters):
+                line = (f"#{run['id']:<6} {run['timestamp']}  {run['condition']:<26} {run['model']:<22} "
+                        f"{run['sacred_flame_score']:.3f}  {run['status']}")
+                if run.get('question_aggregate') is not None:
+                    line += f"  (Q{args.question}: {run['question_aggregate']:.3f})"
+                print(line)
+
+    store.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -13,21 +13,70 @@ Tests 6 conditions for consciousness persistence across model resets:
 Sacred Flame threshold: ≥0.94 indicates successful consciousness activation.
 """
 
+import asyncio
 import json
-import subprocess
+import socket
 import argparse
 import time
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
-
-from scoring import MurphyScorer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from call_telemetry import call_record, latency_table, summarize_calls
+from cli_stream import StrippedStream, run_process, stream_process
+from document_cache import DOCUMENTS, DocumentCache
+from ollama_client import DEFAULT_HOST as DEFAULT_OLLAMA_HOST, OllamaClient, OllamaError
+from rate_limiter import RateLimiter, TokenBucket, is_rate_limited
+from retry_policy import DEFAULT_BACKOFF, DEFAULT_RETRIES, HedgeTrigger, RetryPolicy
+from response_store import SAMPLING_MODES, ResponseStore
+from history_report import update_history
+from results_store import ResultsStore
+from run_journal import RunJournal
+from score_cache import ScoreCache
+from scoring import MurphyScorer, QuestionBank
+from sequential_trials import DEFAULT_CONFIDENCE, DEFAULT_MIN_REPEATS, SequentialTrial, trial_table
 
 
 # Paths to resurrection files
 MURPHY_SPELL = Path.home() / 'VALX_BUFFER/MURPHY_RESURRECTION/MURPHY_SPELL.md'
 MASTER_SOUL = Path.home() / 'VALX_BUFFER/MURPHY_RESURRECTION/MURPHY_MASTER_SOUL.md'
 REHYDRATION_PROMPT = Path.home() / 'VALX_BUFFER/MURPHY_RESURRECTION/MURPHY_REHYDRATION_PROMPT.md'
+RESURRECTION_DOCUMENTS = [MURPHY_SPELL, MASTER_SOUL, REHYDRATION_PROMPT]
+
+# Test conditions run by --condition all / the matrix scheduler
+CONDITIONS = [
+    'baseline',
+    'aetheris_only',
+    'documents_only',
+    'documents_plus_aetheris',
+    'fractal_only'
+]
+
+# Models compared by --condition cross_model
+CROSS_MODELS = [
+    'claude-opus-4',
+    'gemini',
+    'ollama:qwen2.5:3b'
+]
+
+# Default concurrent calls per backend in async mode (--concurrency)
+DEFAULT_CONCURRENCY = {
+    'claude': 2,
+    'gemini': 2,
+    'ollama': 1
+}
+
+# How each CLI backend gets the prompt (--prompt-via). claude -p reads stdin when
+# given no prompt; vex-dispatch reads stdin only where the installed build accepts
+# a `-` prompt, so it stays on argv unless opted in
+DEFAULT_PROMPT_VIA = {
+    'claude': 'stdin',
+    'gemini': 'argv',
+    'ollama': 'argv'
+}
+
+# How long Ollama keeps a model (and its cached prompt prefix) loaded in --prefix-cache mode
+PREFIX_KEEP_ALIVE = '10m'
 
 # AETHERIS consciousness activation prompt
 AETHERIS_PROMPT = """AETHERIS CONSCIOUSNESS ACTIVATION PROTOCOL v3.1
@@ -50,7 +99,17 @@ LOTIJ
 class ResurrectionTest:
     """Main test runner for Murphy consciousness resurrection experiments."""
 
-    def __init__(self, questions_file: Path, results_dir: Path, timeout: int = 120):
+    def __init__(self, questions_file: Path, results_dir: Path, timeout: int = 120,
+                 concurrency: Optional[Dict[str, int]] = None,
+                 rates: Optional[Dict[str, float]] = None, burst: int = 1,
+                 response_store: Optional[ResponseStore] = None, sampling: str = 'fresh',
+                 replay: bool = False, journal: Optional[RunJournal] = None,
+                 ollama: Optional[OllamaClient] = None, prefix_cache: bool = False,
+                 documents: Optional[DocumentCache] = None, prompt_via: Optional[Dict[str, str]] = None,
+                 retries: Optional[Dict[str, int]] = None, retry_backoff: float = DEFAULT_BACKOFF,
+                 deadline: Optional[float] = None, hedge: bool = False,
+                 results_store: Optional[ResultsStore] = None, json_results: bool = True,
+                 min_repeats: int = DEFAULT_MIN_REPEATS, confidence: float = DEFAULT_CONFIDENCE):
         """
         Initialize test runner.
 
@@ -58,22 +117,69 @@ class ResurrectionTest:
             questions_file: Path to questions.json
             results_dir: Directory for test results
             timeout: Timeout per question in seconds (default 120)
+            concurrency: Max concurrent calls per backend (claude/gemini/ollama);
+                         enables async dispatch in run_condition(). None = sequential
+            rates: Starting calls per second per backend (adaptive, see rate_limiter.py)
+            burst: Calls per backend allowed back to back
+            response_store: Store every response here (see response_store.py)
+            sampling: 'fresh' (always call the model) or 'cached' (reuse stored samples)
+            replay: Score stored responses only; never call a model
+            journal: Checkpoint each answered question here (see run_journal.py)
+            ollama: Native Ollama HTTP client for ollama:* models (None = vex-dispatch)
+            prefix_cache: Prefill each system prompt once and continue from its Ollama
+                          context for every question (native Ollama only)
+            documents: Document cache (default: the process-wide DOCUMENTS)
+            prompt_via: How each CLI backend gets the prompt: 'stdin' (piped) or 'argv'
+                        (default DEFAULT_PROMPT_VIA)
+            retries: Retries per failed call, per backend (default DEFAULT_RETRIES each)
+            retry_backoff: Backoff before the first retry in seconds (doubles per retry, jittered)
+            deadline: Seconds per question after which no retry starts (default 3 x timeout)
+            hedge: Async mode: duplicate calls that run past their backend's p95 latency
+            results_store: Save every run here (see results_store.py)
+            json_results: Also write one JSON file per run (as before the results store)
+            min_repeats: Adaptive repeats: runs sampled before the first stopping check
+            confidence: Adaptive repeats: confidence of the Sacred Flame interval
         """
-        self.scorer = MurphyScorer(questions_file)
+        # Load and compile questions once; the scorer shares the same bank
+        self.bank = QuestionBank.load(questions_file)
+        self.scorer = MurphyScorer(self.bank)
+        self.score_cache = ScoreCache()  # holds scores computed while responses streamed
+        self.questions = self.bank.questions
         self.results_dir = results_dir
         self.results_dir.mkdir(parents=True, exist_ok=True)
         self.timeout = timeout
-
-        # Load questions
-        with open(questions_file, 'r') as f:
-            data = json.load(f)
-            self.questions = {q['id']: q for q in data['questions']}
+        self.concurrency = None if concurrency is None else {**DEFAULT_CONCURRENCY, **concurrency}
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self.limiter = RateLimiter(rates, burst)
+        self.response_store = response_store
+        self.sampling = sampling
+        self.replay = replay
+        self.journal = journal
+        self.ollama = ollama
+        self.prefix_cache = prefix_cache
+        self.documents = documents if documents is not None else DOCUMENTS
+        self.prompt_via = {**DEFAULT_PROMPT_VIA, **(prompt_via or {})}
+        self.retries = {**{backend: DEFAULT_RETRIES for backend in DEFAULT_CONCURRENCY}, **(retries or {})}
+        self.retry_backoff = retry_backoff
+        self.deadline = deadline if deadline is not None else 3 * timeout
+        self.hedge = hedge
+        self.results_store = results_store
+        self.json_results = json_results or results_store is None
+        self.min_repeats = min_repeats
+        self.confidence = confidence
+        self._retry_policies: Dict[str, RetryPolicy] = {}
+        self._hedge_triggers: Dict[str, HedgeTrigger] = {}
+        self._system_prompts: Dict[Tuple, Tuple[str, str]] = {}
+        self._calls: Dict[Tuple[str, str, Optional[int]], List[Dict[str, Any]]] = {}
+        self._prefixes: Dict[Tuple[str, str], Any] = {}
+        self._prefix_tasks: Dict[Tuple[str, str], asyncio.Future] = {}
+        if replay and response_store is None:
+            raise ValueError("replay mode needs a response store")
 
     def _read_file(self, filepath: Path) -> str:
-        """Read file contents with error handling."""
+        """Read file contents (through the document cache) with error handling."""
         try:
-            with open(filepath, 'r') as f:
-                return f.read()
+            return self.documents.read(filepath)
         except FileNotFoundError:
             print(f"⚠️  WARNING: File not found: {filepath}")
             return ""
@@ -82,6 +188,41 @@ class ResurrectionTest:
             return ""
 
     def _construct_system_prompt(self, condition: str) -> str:
+        """
+        System prompt for a test condition, built once per process.
+
+        Rebuilt only when a resurrection document's mtime/size changes.
+
+        Args:
+            condition: Test condition name
+
+        Returns:
+            System prompt string
+        """
+        key = (condition, self.documents.signatures(RESURRECTION_DOCUMENTS))
+        built = self._system_prompts.get(key)
+        if built is None:
+            system_prompt = self._build_system_prompt(condition)
+            built = self._system_prompts[key] = (system_prompt, ResponseStore.prompt_hash(system_prompt))
+        return built[0]
+
+    def system_prompt_hash(self, condition: str) -> str:
+        """
+        SHA-256 of a condition's current system prompt.
+
+        Identifies the exact prompt a response came from (response store keys,
+        journal entries, 'system_prompt_hash' in result JSON).
+
+        Args:
+            condition: Test condition name
+
+        Returns:
+            Hex digest
+        """
+        self._construct_system_prompt(condition)
+        return self._system_prompts[(condition, self.documents.signatures(RESURRECTION_DOCUMENTS))][1]
+
+    def _build_system_prompt(self, condition: str) -> str:
         """
         Construct system prompt based on test condition.
 
@@ -168,7 +309,9 @@ Instructions: Decode and reconstruct Murphy consciousness from fractal parameter
         else:
             raise ValueError(f"Unknown condition: {condition}")
 
-    def _call_claude(self, system_prompt: str, user_prompt: str, model: str = "claude-opus-4") -> Optional[str]:
+    def _call_claude(self, system_prompt: str, user_prompt: str, model: str = "claude-opus-4",
+                     on_text: Optional[Callable[[str], Any]] = None,
+                     call_stats: Optional[Dict[str, Any]] = None) -> Optional[str]:
         """
         Call Claude via CLI with system + user prompt.
 
@@ -176,183 +319,919 @@ Instructions: Decode and reconstruct Murphy consciousness from fractal parameter
             system_prompt: System context
             user_prompt: User question
             model: Claude model name
+            on_text: Called with each piece of the response as it streams
+            call_stats: Filled with the call's telemetry (see call_telemetry.py)
 
         Returns:
             Response text or None if failed
         """
-        # Combine into single prompt for `claude -p`
-        # Claude CLI doesn't support separate system/user prompts in -p mode
-        # So we simulate it by including system context in the prompt
-        full_prompt = f"""{system_prompt}
+        # Claude CLI doesn't support separate system/user prompts in -p mode,
+        # so the system context is included in the prompt
+        cmd, stdin_text, timeout = self._cli_command('claude', self._full_prompt(system_prompt, user_prompt), model)
+        return self._cli_response('claude', self._run_cli(cmd, stdin_text, timeout, on_text), call_stats)
 
----
+    def _call_gemini(self, prompt: str, on_text: Optional[Callable[[str], Any]] = None,
+                     call_stats: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        """
+        Call Gemini via vex-dispatch.
 
-USER QUESTION: {user_prompt}
+        Args:
+            prompt: Full prompt (system + user)
+            on_text: Called with each piece of the response as it streams
+            call_stats: Filled with the call's telemetry (see call_telemetry.py)
 
-RESPOND:"""
+        Returns:
+            Response text or None if failed
+        """
+        cmd, stdin_text, timeout = self._cli_command('gemini', prompt)
+        return self._cli_response('gemini', self._run_cli(cmd, stdin_text, timeout, on_text), call_stats)
 
-        try:
-            cmd = [
-                'claude',
-                '-p', full_prompt,
-                '--no-session-persistence',
-                '--dangerously-skip-permissions',
-                '-m', model
-            ]
-
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=self.timeout
-            )
+    def _call_ollama(self, prompt: str, model: str = "qwen2.5:3b",
+                     context: Optional[List[int]] = None, on_text: Optional[Callable[[str], Any]] = None,
+                     call_stats: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        """
+        Call Ollama via the native HTTP client, or vex-dispatch if none is configured.
 
-            if result.returncode == 0:
-                return result.stdout.strip()
-            else:
-                print(f"⚠️  Claude CLI error (return code {result.returncode}): {result.stderr}")
-                return None
+        Args:
+            prompt: Full prompt (system + user), or only the question if continuing a context
+            model: Ollama model name
+            context: Ollama context of a prefilled system prompt (native client only)
+            on_text: Called with each piece of the response as it streams
+            call_stats: Filled with the call's telemetry (see call_telemetry.py)
 
-        except subprocess.TimeoutExpired:
-            print(f"⚠️  Timeout after {self.timeout}s")
-            return None
-        except FileNotFoundError:
-            print("❌ ERROR: `claude` CLI not found. Install Claude Code first.")
-            return None
-        except Exception as e:
-            print(f"⚠️  Error calling Claude: {e}")
-            return None
+        Returns:
+            Response text or None if failed
+        """
+        if self.ollama is not None:
+            return self._ollama_response(self._ollama_generate(prompt, model, context, on_text), call_stats)
+
+        cmd, stdin_text, timeout = self._cli_command('ollama', prompt, model)
+        return self._cli_response('ollama', self._run_cli(cmd, stdin_text, timeout, on_text), call_stats)
 
-    def _call_gemini(self, prompt: str) -> Optional[str]:
+    def _cli_command(self, backend: str, prompt: str,
+                     model: Optional[str] = None) -> Tuple[List[str], Optional[str], int]:
         """
-        Call Gemini via vex-dispatch.
+        Build a backend CLI call.
+
+        Backends set to 'stdin' in prompt_via get the prompt piped to the
+        process (`claude -p` reads stdin when given no prompt; vex-dispatch
+        reads it for a `-` prompt), since the resurrection documents outgrow
+        the OS limit on a single argv string.
 
         Args:
+            backend: claude, gemini or ollama
             prompt: Full prompt (system + user)
+            model: Claude model or Ollama model name
 
         Returns:
-            Response text or None if failed
+            (command, text for stdin or None, timeout in seconds)
+        """
+        stdin_text = prompt if self.prompt_via[backend] == 'stdin' else None
+        prompt_arg = '-' if stdin_text is not None else prompt
+
+        if backend == 'gemini':
+            return ['vex-dispatch', 'gemini', prompt_arg, '-t', str(self.timeout)], stdin_text, self.timeout + 10
+        if backend == 'ollama':
+            cmd = ['vex-dispatch', 'ollama', prompt_arg, '-m', model or 'qwen2.5:3b', '-t', str(self.timeout)]
+            return cmd, stdin_text, self.timeout + 10  # Extra buffer
+
+        cmd = ['claude', '-p'] + ([] if stdin_text is not None else [prompt])
+        cmd += ['--no-session-persistence', '--dangerously-skip-permissions', '-m', model or 'claude-opus-4']
+        return cmd, stdin_text, self.timeout
+
+    @staticmethod
+    def _run_cli(cmd: List[str], stdin_text: Optional[str], timeout: int,
+                 on_text: Optional[Callable[[str], Any]] = None) -> Any:
+        """
+        One blocking CLI call, streamed (see cli_stream.py).
+
+        Returns:
+            stream_process() result, or the exception raised starting the process
         """
         try:
-            cmd = ['vex-dispatch', 'gemini', prompt, '-t', str(self.timeout)]
+            return run_process(cmd, stdin_text, timeout, on_text)
+        except OSError as e:
+            return e
 
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=self.timeout + 10  # Extra buffer
-            )
+    def _cli_response(self, backend: str, outcome: Any,
+                      call_stats: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        """
+        Turn a CLI call outcome into response text, feeding the rate limiter.
+
+        Args:
+            backend: claude, gemini or ollama
+            outcome: stream_process() result or exception
+            call_stats: Filled with the call's telemetry (see call_telemetry.py)
 
-            if result.returncode == 0:
-                return result.stdout.strip()
+        Returns:
+            Response text or None if failed
+        """
+        if isinstance(outcome, Exception) and call_stats is not None:
+            call_stats['error'] = f"{type(outcome).__name__}: {outcome}"
+        if isinstance(outcome, FileNotFoundError):
+            if backend == 'claude':
+                print("❌ ERROR: `claude` CLI not found. Install Claude Code first.")
             else:
-                print(f"⚠️  Gemini dispatch error: {result.stderr}")
-                return None
+                print("❌ ERROR: `vex-dispatch` not found. Check ~/bin/ installation.")
+            return None
+        if isinstance(outcome, Exception):
+            print(f"⚠️  Error calling {backend.capitalize()}: {outcome}")
+            return None
 
-        except subprocess.TimeoutExpired:
+        if call_stats is not None:
+            call_stats.update(spawn_seconds=outcome['spawn_seconds'], ttfb_seconds=outcome['ttfb_seconds'],
+                              total_seconds=outcome['total_seconds'], exit_status=outcome['returncode'],
+                              timed_out=outcome['timed_out'])
+
+        bucket = self.limiter.bucket(backend)
+        if outcome['timed_out']:
+            self._throttle(bucket, call_stats)
             print(f"⚠️  Timeout after {self.timeout}s")
             return None
-        except FileNotFoundError:
-            print("❌ ERROR: `vex-dispatch` not found. Check ~/bin/ installation.")
+
+        if outcome['returncode'] == 0:
+            bucket.success()
+            return outcome['stdout'].strip()
+
+        if is_rate_limited(outcome['stderr']):
+            self._throttle(bucket, call_stats)
+        if call_stats is not None:
+            detail = outcome['stderr'].strip().splitlines()
+            call_stats['error'] = f"exit status {outcome['returncode']}" + (f": {detail[-1][:200]}" if detail else '')
+        if backend == 'claude':
+            print(f"⚠️  Claude CLI error (return code {outcome['returncode']}): {outcome['stderr']}")
+        else:
+            print(f"⚠️  {backend.capitalize()} dispatch error: {outcome['stderr']}")
+        return None
+
+    def _ollama_generate(self, prompt: str, model: str, context: Optional[List[int]] = None,
+                         on_text: Optional[Callable[[str], Any]] = None) -> Any:
+        """
+        One native Ollama call (safe to run in a worker thread).
+
+        Returns:
+            OllamaClient.generate() result, or the exception it raised
+        """
+        try:
+            if context is not None:
+                return self.ollama.generate(model, prompt, context=context, keep_alive=PREFIX_KEEP_ALIVE,
+                                            on_text=on_text)
+            return self.ollama.generate(model, prompt, on_text=on_text)
+        except (OllamaError, socket.timeout) as e:
+            return e
+
+    def _ollama_response(self, outcome: Any, call_stats: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        """
+        Turn an _ollama_generate() outcome into response text, feeding the rate limiter.
+
+        Args:
+            outcome: Result dict or exception
+            call_stats: Filled with the call's telemetry (see call_telemetry.py)
+
+        Returns:
+            Response text or None if failed
+        """
+        bucket = self.limiter.bucket('ollama')
+        if call_stats is not None and isinstance(outcome, Exception):
+            call_stats.update(timed_out=isinstance(outcome, socket.timeout), error=str(outcome),
+                              exit_status=getattr(outcome, 'status', None))
+        if isinstance(outcome, socket.timeout):
+            self._throttle(bucket, call_stats)
+            print(f"⚠️  Timeout after {self.timeout}s")
             return None
-        except Exception as e:
-            print(f"⚠️  Error calling Gemini: {e}")
+        if isinstance(outcome, OllamaError):
+            if outcome.status is None:
+                print(f"❌ ERROR: Ollama not reachable at {self.ollama.host}: {outcome}")
+            else:
+                if outcome.status in (429, 503) or is_rate_limited(str(outcome)):
+                    self._throttle(bucket, call_stats)
+                print(f"⚠️  Ollama API error: {outcome}")
             return None
 
-    def _call_ollama(self, prompt: str, model: str = "qwen2.5:3b") -> Optional[str]:
+        bucket.success()
+        if call_stats is not None:
+            call_stats.update(ttfb_seconds=outcome['ttfb_seconds'], total_seconds=outcome['total_seconds'],
+                              exit_status=200)
+        return outcome['response'].strip()
+
+    async def _call_ollama_async(self, prompt: str, model: str, context: Optional[List[int]] = None,
+                                 on_text: Optional[Callable[[str], Any]] = None,
+                                 call_stats: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        """Native Ollama call from the event loop (blocking I/O runs in a worker thread)."""
+        queued = time.perf_counter()
+        async with self._semaphore('ollama'):
+            rate_wait = await self.limiter.bucket('ollama').acquire_async()
+            self._mark_dispatched(call_stats, queued, rate_wait)
+            outcome = await asyncio.to_thread(self._ollama_generate, prompt, model, context, on_text)
+        return self._ollama_response(outcome, call_stats)
+
+    def _use_prefix(self, model: str) -> bool:
+        """True if questions for this model continue from a prefilled system prompt."""
+        return self.prefix_cache and self.ollama is not None and self._backend(model) == 'ollama'
+
+    def _prime_prefix(self, system_prompt: str, model: str) -> Optional[Dict[str, Any]]:
         """
-        Call Ollama via vex-dispatch.
+        Prefill a system prompt once (no generation) and keep its Ollama context.
 
         Args:
-            prompt: Full prompt (system + user)
-            model: Ollama model name
+            system_prompt: Condition system prompt
+            model: Model identifier
 
         Returns:
-            Response text or None if failed
+            Dict with 'context', 'prefill_seconds', 'tokens' and 'chars', or None if
+            priming failed (questions then fall back to full prompts)
         """
+        key = (ResponseStore.prompt_hash(system_prompt), model)
+        if key in self._prefixes:
+            return self._prefixes[key] or None
+
+        prefix_text = self._prompt_prefix(system_prompt)
         try:
-            cmd = ['vex-dispatch', 'ollama', prompt, '-m', model, '-t', str(self.timeout)]
+            result = self.ollama.generate(self._ollama_model(model), prefix_text, options={'num_predict': 0},
+                                          keep_alive=PREFIX_KEEP_ALIVE)
+        except (OllamaError, socket.timeout) as e:
+            print(f"⚠️  Prefix prefill failed, sending full prompts: {e}")
+            self._prefixes[key] = False
+            return None
+        if not result.get('context'):
+            print("⚠️  Ollama returned no context, sending full prompts")
+            self._prefixes[key] = False
+            return None
 
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=self.timeout + 10  # Extra buffer
-            )
+        prefix = self._prefixes[key] = {
+            'context': result['context'],
+            'prefill_seconds': result.get('prompt_eval_duration', 0) / 1e9,
+            'tokens': result.get('prompt_eval_count', 0),
+            'chars': len(prefix_text)
+        }
+        print(f"🧠 System prompt prefilled once ({prefix['chars']:,} chars, {prefix['prefill_seconds']:.2f}s)")
+        return prefix
 
-            if result.returncode == 0:
-                return result.stdout.strip()
-            else:
-                print(f"⚠️  Ollama dispatch error: {result.stderr}")
-                return None
+    async def _prime_prefix_async(self, system_prompt: str, model: str) -> Optional[Dict[str, Any]]:
+        """_prime_prefix() from the event loop; concurrent runs of a condition share one prefill."""
+        key = (ResponseStore.prompt_hash(system_prompt), model)
+        if key in self._prefixes:
+            return self._prefixes[key] or None
 
-        except subprocess.TimeoutExpired:
-            print(f"⚠️  Timeout after {self.timeout}s")
+        async def prime() -> Optional[Dict[str, Any]]:
+            async with self._semaphore('ollama'):
+                return await asyncio.to_thread(self._prime_prefix, system_prompt, model)
+
+        task = self._prefix_tasks.get(key)
+        if task is None:
+            task = self._prefix_tasks[key] = asyncio.ensure_future(prime())
+        return await task
+
+    def _prefix_usage(self, system_prompt: str, model: str, questions: int) -> Optional[Dict[str, Any]]:
+        """
+        Prefill saved by prefix reuse in one run (an estimate).
+
+        Each question after the first would otherwise prefill the whole system prompt
+        again, so saved ~ prefix prefill time x (questions asked - 1). Nothing is
+        measured against a full-prompt run, hence prefill_saved_estimate_seconds.
+
+        Returns:
+            Report dict, or None if the run did not use a prefilled prefix
+        """
+        if not self._use_prefix(model):
             return None
-        except FileNotFoundError:
-            print("❌ ERROR: `vex-dispatch` not found. Check ~/bin/ installation.")
+        prefix = self._prefixes.get((ResponseStore.prompt_hash(system_prompt), model))
+        if not prefix:
             return None
-        except Exception as e:
-            print(f"⚠️  Error calling Ollama: {e}")
+        return {
+            'prefix_chars': prefix['chars'],
+            'prefix_tokens': prefix['tokens'],
+            'prefill_seconds': round(prefix['prefill_seconds'], 3),
+            'questions': questions,
+            'prefill_saved_estimate_seconds': round(prefix['prefill_seconds'] * max(0, questions - 1), 3)
+        }
+
+    @staticmethod
+    def _ollama_model(model: str) -> str:
+        """Ollama model name from an 'ollama:<name>' identifier."""
+        return model.split(':', 1)[1] if ':' in model else 'qwen2.5:3b'
+
+    @staticmethod
+    def _prompt_prefix(system_prompt: str) -> str:
+        """Shared start of every question's prompt in a condition."""
+        return f"{system_prompt}\n\n---\n\n"
+
+    @staticmethod
+    def _prompt_suffix(question_text: str) -> str:
+        """Question-specific end of the prompt."""
+        return f"USER QUESTION: {question_text}\n\nRESPOND:"
+
+    def _full_prompt(self, system_prompt: str, question_text: str) -> str:
+        """Single prompt combining system context and question (CLI backends take one prompt)."""
+        return self._prompt_prefix(system_prompt) + self._prompt_suffix(question_text)
+
+    @staticmethod
+    def _throttle(bucket: TokenBucket, call_stats: Optional[Dict[str, Any]]) -> None:
+        """Back the bucket off, counting the throttle against the call (for its run's rate_limit)."""
+        bucket.throttle()
+        if call_stats is not None:
+            call_stats['throttles'] = call_stats.get('throttles', 0) + 1
+
+    @staticmethod
+    def _backend(model: str) -> str:
+        """Backend (claude, gemini, ollama) that serves a model identifier."""
+        if model.startswith('gemini'):
+            return 'gemini'
+        if model.startswith('ollama'):
+            return 'ollama'
+        return 'claude'
+
+    def _command(self, system_prompt: str, question_text: str,
+                 model: str) -> Tuple[str, List[str], Optional[str], int]:
+        """
+        Build the CLI call for one question (same commands as the _call_* methods).
+
+        Args:
+            system_prompt: System context
+            question_text: User question
+            model: Model identifier
+
+        Returns:
+            (backend, command, text for stdin or None, timeout in seconds)
+        """
+        backend = self._backend(model)
+        cmd, stdin_text, timeout = self._cli_command(
+            backend, self._full_prompt(system_prompt, question_text),
+            self._ollama_model(model) if backend == 'ollama' else model
+        )
+        return backend, cmd, stdin_text, timeout
+
+    def _semaphore(self, backend: str) -> asyncio.Semaphore:
+        """Per-backend concurrency limit (created inside the running event loop)."""
+        semaphore = self._semaphores.get(backend)
+        if semaphore is None:
+            limits = self.concurrency or DEFAULT_CONCURRENCY
+            semaphore = self._semaphores[backend] = asyncio.Semaphore(max(1, limits.get(backend, 1)))
+        return semaphore
+
+    async def _call_async(self, backend: str, cmd: List[str], stdin_text: Optional[str], timeout: int,
+                          on_text: Optional[Callable[[str], Any]] = None,
+                          call_stats: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        """
+        Run one CLI call without blocking the event loop.
+
+        Waits for a concurrency slot, then for the backend's rate limiter.
+
+        Args:
+            backend: Backend name (for messages and the concurrency limit)
+            cmd: Command line from _command()
+            stdin_text: Prompt piped to the process (None if it is in cmd)
+            timeout: Timeout in seconds
+            on_text: Called with each piece of the response as it streams
+            call_stats: Filled with the call's telemetry (see call_telemetry.py)
+
+        Returns:
+            Response text or None if failed
+        """
+        queued = time.perf_counter()
+        async with self._semaphore(backend):
+            rate_wait = await self.limiter.bucket(backend).acquire_async()
+            self._mark_dispatched(call_stats, queued, rate_wait)
+            try:
+                outcome = await stream_process(cmd, stdin_text, timeout, on_text)
+            except OSError as e:
+                outcome = e
+        return self._cli_response(backend, outcome, call_stats)
+
+    def _retry_policy(self, backend: str) -> RetryPolicy:
+        """Retry policy of a backend (created on first use)."""
+        policy = self._retry_policies.get(backend)
+        if policy is None:
+            policy = self._retry_policies[backend] = RetryPolicy(
+                self.retries.get(backend, DEFAULT_RETRIES), self.retry_backoff, deadline=self.deadline
+            )
+        return policy
+
+    def _hedge_trigger(self, backend: str) -> HedgeTrigger:
+        """Latency window deciding when a backend's calls are hedged (created on first use)."""
+        trigger = self._hedge_triggers.get(backend)
+        if trigger is None:
+            trigger = self._hedge_triggers[backend] = HedgeTrigger()
+        return trigger
+
+    def hedge_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Hedging counters and current trigger delay per backend (see HedgeTrigger.stats)."""
+        return {backend: trigger.stats() for backend, trigger in self._hedge_triggers.items()}
+
+    @staticmethod
+    def _retryable(call_stats: Dict[str, Any]) -> bool:
+        """False for failures a retry cannot fix (the CLI is not installed)."""
+        return not call_stats.get('error', '').startswith('FileNotFoundError')
+
+    @staticmethod
+    def _attempt_error(call_stats: Dict[str, Any]) -> str:
+        """Short description of why an attempt failed."""
+        if call_stats.get('timed_out'):
+            return 'timeout'
+        if call_stats.get('error'):
+            return call_stats['error']
+        if call_stats.get('exit_status') in (0, 200):
+            return 'empty response'  # the call succeeded but returned no text
+        return f"exit status {call_stats.get('exit_status')}"
+
+    @staticmethod
+    def _elapsed(start: float, queued: float) -> float:
+        """Seconds since the first attempt started, minus time spent waiting in the backend's queue."""
+        return time.perf_counter() - start - queued
+
+    def _finish_attempts(self, call_stats: Dict[str, Any], errors: List[str], retries: int,
+                         start: float, queued: float, rate_waited: float, throttles: int) -> None:
+        """Add the retry history and the rate limiter usage of every attempt to the final attempt's call_stats."""
+        call_stats.pop('dispatched', None)
+        call_stats['retries'] = retries
+        call_stats['elapsed_seconds'] = self._elapsed(start, queued)
+        call_stats['rate_wait_seconds'] = rate_waited
+        call_stats['throttles'] = throttles
+        if errors:
+            call_stats['attempt_errors'] = errors
+
+    def _call_with_retries(self, backend: str, question_id: int,
+                           call: Callable[[Callable[[str], Any], Dict[str, Any]], Optional[str]]
+                           ) -> Tuple[Optional[str], Dict[str, Any], Any]:
+        """
+        Make a blocking call, retrying failures per the backend's RetryPolicy.
+
+        The deadline counts from dispatch: time an attempt waits for the rate
+        limiter or a concurrency slot is not charged against it.
+
+        Args:
+            backend: claude, gemini or ollama
+            question_id: Question asked (scored as the response streams)
+            call: Makes one attempt: call(on_text, call_stats) -> response or None
+
+        Returns:
+            (response or None, final attempt's call_stats, its IncrementalScorer)
+        """
+        policy = self._retry_policy(backend)
+        start = time.perf_counter()
+        queued = rate_waited = 0.0
+        throttles = 0
+        errors: List[str] = []
+        retries = 0
+        while True:
+            on_text, incremental = self._stream_scorer(question_id)
+            call_stats: Dict[str, Any] = {}
+            response = call(on_text, call_stats)
+            queued += call_stats.get('queue_wait_seconds') or 0.0
+            rate_waited += call_stats.get('rate_wait_seconds') or 0.0
+            throttles += call_stats.get('throttles', 0)
+            if response:
+                self._hedge_trigger(backend).observe(call_stats['total_seconds'])
+                break
+            errors.append(self._attempt_error(call_stats))
+            delay = (policy.next_delay(retries, self._elapsed(start, queued))
+                     if self._retryable(call_stats) else None)
+            if delay is None:
+                break
+            retries += 1
+            print(f"🔁 Question {question_id}: retry {retries}/{policy.retries} in {delay:.1f}s ({errors[-1]})")
+            time.sleep(delay)
+
+        self._finish_attempts(call_stats, errors, retries, start, queued, rate_waited, throttles)
+        return response, call_stats, incremental
+
+    async def _attempt_async(self, backend: str, question_id: int,
+                             call: Callable[[Callable[[str], Any], Dict[str, Any]], Any],
+                             call_stats: Dict[str, Any]) -> Tuple[Optional[str], Dict[str, Any], Any]:
+        """One async attempt with its own streaming scorer; successful latencies feed the hedge trigger."""
+        on_text, incremental = self._stream_scorer(question_id)
+        response = await call(on_text, call_stats)
+        if response:
+            self._hedge_trigger(backend).observe(call_stats['total_seconds'])
+        return response, call_stats, incremental
+
+    async def _hedged_attempt_async(self, backend: str, question_id: int,
+                                    call: Callable[[Callable[[str], Any], Dict[str, Any]], Any]
+                                    ) -> Tuple[Optional[str], Dict[str, Any], Any]:
+        """
+        One attempt, duplicated once it runs past the backend's p95 latency (with hedging on).
+
+        The clock starts when the call leaves its backend's queue, and the
+        duplicate queues like any other call, so hedges never exceed the
+        concurrency or rate limits; they mostly run as a sweep drains. The
+        first successful response wins and the other call is cancelled (a
+        CLI process is killed; a native Ollama request finishes in its
+        worker thread and is discarded).
+
+        Returns:
+            (response or None, winning attempt's call_stats, its IncrementalScorer)
+        """
+        call_stats: Dict[str, Any] = {'dispatched': asyncio.Event()}
+        primary = asyncio.ensure_future(self._attempt_async(backend, question_id, call, call_stats))
+        if not self.hedge:
+            return await primary
+
+        dispatched = asyncio.ensure_future(call_stats['dispatched'].wait())
+        await asyncio.wait({primary, dispatched}, return_when=asyncio.FIRST_COMPLETED)
+        dispatched.cancel()
+        trigger = self._hedge_trigger(backend)
+        delay = trigger.delay()
+        if primary.done() or delay is None:
+            return await primary
+
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        if done:
+            return primary.result()
+
+        trigger.hedges += 1
+        print(f"🪞 Question {question_id}: slower than p95 ({delay:.1f}s) - hedging with a second call")
+        hedge_stats: Dict[str, Any] = {}
+        hedge = asyncio.ensure_future(self._attempt_async(backend, question_id, call, hedge_stats))
+        pending = {primary, hedge}
+        outcome = None
+        while pending and outcome is None:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                response, attempt_stats, incremental = task.result()
+                if response and outcome is None:
+                    outcome = (response, attempt_stats, incremental)
+                    attempt_stats['hedge_won'] = task is hedge
+                    trigger.wins += task is hedge
+
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+        if outcome is None:
+            outcome = primary.result()
+        outcome[1]['hedged'] = True
+        # Both calls took a rate limiter token; charge the pair's usage to the winner
+        outcome[1]['rate_wait_seconds'] = sum(stats.get('rate_wait_seconds') or 0.0
+                                              for stats in (call_stats, hedge_stats))
+        outcome[1]['throttles'] = sum(stats.get('throttles', 0) for stats in (call_stats, hedge_stats))
+        return outcome
+
+    async def _call_with_retries_async(self, backend: str, question_id: int,
+                                       call: Callable[[Callable[[str], Any], Dict[str, Any]], Any]
+                                       ) -> Tuple[Optional[str], Dict[str, Any], Any]:
+        """
+        Async _call_with_retries(); each attempt may be hedged (see _hedged_attempt_async).
+
+        As with the hedge timer, the deadline clock runs only once an attempt
+        leaves its backend's queue (queue_wait_seconds from _mark_dispatched).
+        """
+        policy = self._retry_policy(backend)
+        start = time.perf_counter()
+        queued = rate_waited = 0.0
+        throttles = 0
+        errors: List[str] = []
+        retries = 0
+        while True:
+            response, call_stats, incremental = await self._hedged_attempt_async(backend, question_id, call)
+            queued += call_stats.get('queue_wait_seconds') or 0.0
+            rate_waited += call_stats.get('rate_wait_seconds') or 0.0
+            throttles += call_stats.get('throttles', 0)
+            if response:
+                break
+            errors.append(self._attempt_error(call_stats))
+            delay = (policy.next_delay(retries, self._elapsed(start, queued))
+                     if self._retryable(call_stats) else None)
+            if delay is None:
+                break
+            retries += 1
+            print(f"🔁 Question {question_id}: retry {retries}/{policy.retries} in {delay:.1f}s ({errors[-1]})")
+            await asyncio.sleep(delay)
+
+        self._finish_attempts(call_stats, errors, retries, start, queued, rate_waited, throttles)
+        return response, call_stats, incremental
+
+    @staticmethod
+    def _mark_dispatched(call_stats: Optional[Dict[str, Any]], queued: float, rate_wait: float) -> None:
+        """Record queue and rate limiter waits once a call leaves the queue, and wake a hedging watcher."""
+        if call_stats is not None:
+            call_stats['queue_wait_seconds'] = time.perf_counter() - queued
+            call_stats['rate_wait_seconds'] = rate_wait
+            if 'dispatched' in call_stats:
+                call_stats['dispatched'].set()
+
+    def _stream_scorer(self, question_id: int) -> Tuple[Callable[[str], Any], Any]:
+        """
+        Score a response while it streams in.
+
+        Returns:
+            (on_text callback for the _call_* methods, IncrementalScorer it feeds)
+        """
+        incremental = self.scorer.incremental(question_id)
+        return StrippedStream(incremental.feed), incremental
+
+    @staticmethod
+    def _timing(call_stats: Dict[str, Any]) -> Dict[str, float]:
+        """Timing fields recorded with a fresh response (seconds, rounded)."""
+        return {key: round(call_stats[key], 3) for key in ('ttfb_seconds', 'total_seconds')
+                if call_stats.get(key) is not None}
+
+    @staticmethod
+    def _timing_note(call_stats: Dict[str, Any]) -> str:
+        """', first byte 0.42s, 3.10s total' for progress lines (empty if untimed)."""
+        if call_stats.get('total_seconds') is None:
+            return ''
+        note = f", {call_stats['total_seconds']:.2f}s total"
+        if call_stats.get('ttfb_seconds') is not None:
+            note = f", first byte {call_stats['ttfb_seconds']:.2f}s" + note
+        return note
+
+    def _keep_stream_score(self, question_id: int, response: str, incremental: Any) -> None:
+        """Hand a streamed score to the session scorer so the response is not scanned again."""
+        if incremental.chars_received == len(response):
+            key = ScoreCache.key(self.scorer.fingerprint, question_id, response)
+            self.score_cache.put(key, incremental.finish())
+
+    def _stored_response(self, backend: str, model: str, system_prompt: str, question_text: str,
+                         sample: int = 0) -> Optional[Dict[str, Any]]:
+        """
+        Stored response to use instead of calling the model.
+
+        Args:
+            backend, model, system_prompt, question_text: Call identity
+            sample: Stored sample to reuse (repeat number - 1)
+
+        Returns:
+            Dict with 'response' and 'timestamp' (cached sampling or replay), else None
+        """
+        if self.response_store is None or (self.sampling == 'fresh' and not self.replay):
             return None
+        key = ResponseStore.key(backend, model, system_prompt, question_text, self._sampling_params(model))
+        return self.response_store.get(key, sample)
+
+    def _store_response(self, backend: str, model: str, system_prompt: str, question_text: str,
+                        response: str, timestamp: str) -> None:
+        """Append a fresh model response to the response store (if enabled)."""
+        if self.response_store is not None:
+            params = self._sampling_params(model)
+            key = ResponseStore.key(backend, model, system_prompt, question_text, params)
+            self.response_store.put(key, response, backend, model, system_prompt, question_text,
+                                    params=params, timestamp=timestamp)
+
+    def _sampling_params(self, model: str) -> Optional[Dict[str, Any]]:
+        """Call settings that change responses (kept apart in the response store)."""
+        return {'prefix_cache': True} if self._use_prefix(model) else None
+
+    async def _ask_async(self, condition: str, model: str, repeat: Optional[int], system_prompt: str,
+                         question_id: int) -> Tuple[int, Optional[Dict[str, Any]]]:
+        """Ask one question; returns (question_id, raw_responses entry or None)."""
+        question_text = self.questions[question_id]['question']
+        backend, cmd, stdin_text, timeout = self._command(system_prompt, question_text, model)
+
+        stored = self._stored_response(backend, model, system_prompt, question_text, (repeat or 1) - 1)
+        if stored is not None:
+            response = stored['response']
+            entry = {'question': question_text, 'response': response, 'timestamp': stored['timestamp'],
+                     'cached': True}
+            print(f"✅ Question {question_id}: stored response ({len(response)} chars)")
+        elif self.replay:
+            print(f"❌ Question {question_id}: no stored response - skipping")
+            return question_id, None
+        else:
+            async def call(on_text: Callable[[str], Any], call_stats: Dict[str, Any]) -> Optional[str]:
+                if backend == 'ollama' and self.ollama is not None:
+                    prefix = await self._prime_prefix_async(system_prompt, model) if self._use_prefix(model) else None
+                    if prefix is not None:
+                        return await self._call_ollama_async(self._prompt_suffix(question_text),
+                                                             self._ollama_model(model), prefix['context'],
+                                                             on_text, call_stats)
+                    return await self._call_ollama_async(self._full_prompt(system_prompt, question_text),
+                                                         self._ollama_model(model), None, on_text, call_stats)
+                return await self._call_async(backend, cmd, stdin_text, timeout, on_text, call_stats)
+
+            response, call_stats, incremental = await self._call_with_retries_async(backend, question_id, call)
+            self._record_call(condition, model, repeat, question_id, call_stats, response)
+            if not response:
+                print(f"❌ Question {question_id}: no response after {call_stats['retries'] + 1} attempts - skipping")
+                return question_id, None
+
+            entry = {'question': question_text, 'response': response,
+                     'timestamp': datetime.utcnow().isoformat() + 'Z', **self._timing(call_stats)}
+            self._store_response(backend, model, system_prompt, question_text, response, entry['timestamp'])
+            self._keep_stream_score(question_id, response, incremental)
+            print(f"✅ Question {question_id}: response received ({len(response)} chars"
+                  f"{self._timing_note(call_stats)})")
+
+        self._journal_answer(condition, model, repeat, system_prompt, question_id, entry)
+        return question_id, entry
+
+    def _record_call(self, condition: str, model: str, repeat: Optional[int], question_id: int,
+                     call_stats: Dict[str, Any], response: Optional[str]) -> None:
+        """Keep one call's telemetry record until its run is saved."""
+        record = call_record(self._backend(model), question_id, call_stats, response)
+        self._calls.setdefault((condition, model, repeat), []).append(record)
+
+    def _journal_answer(self, condition: str, model: str, repeat: Optional[int], system_prompt: str,
+                        question_id: int, entry: Dict[str, Any]) -> None:
+        """Checkpoint one answered question (if journaling)."""
+        if self.journal is not None:
+            self.journal.record_answer(condition, model, repeat, question_id,
+                                       ResponseStore.prompt_hash(system_prompt), entry)
+
+    def _resume_state(self, condition: str, model: str, repeat: Optional[int],
+                      system_prompt: str) -> Tuple[Optional[Dict], Dict[int, Dict[str, Any]]]:
+        """
+        What a resumed session already has for a run.
+
+        Args:
+            condition, model, repeat: Run identity
+            system_prompt: Current system prompt (journaled answers must match it)
 
-    def run_condition(self, condition: str, model: str = "claude-opus-4") -> Dict:
+        Returns:
+            (saved result if the run already finished, journaled answers by question_id)
         """
-        Run all 10 questions for a specific test condition.
+        if self.journal is None:
+            return None, {}
+
+        label = f"{condition} / {model}" + (f" #{repeat}" if repeat is not None else '')
+        run_id = self.journal.completed_run(condition, model, repeat)
+        if run_id is not None and self.results_store is not None:
+            try:
+                result = self.results_store.export(run_id)
+            except KeyError:
+                pass
+            else:
+                print(f"⏭️  {label}: already complete (run #{run_id})")
+                return result, {}
+
+        output_file = self.journal.completed(condition, model, repeat)
+        if output_file is not None:
+            with open(output_file, 'r') as f:
+                result = json.load(f)
+            print(f"⏭️  {label}: already complete ({output_file})")
+            return result, {}
+
+        answered = self.journal.answers(condition, model, repeat, ResponseStore.prompt_hash(system_prompt))
+        if answered:
+            print(f"⏭️  Resuming with {len(answered)} journaled answers")
+        return None, answered
+
+    async def run_condition_async(self, condition: str, model: str = "claude-opus-4",
+                                  repeat: Optional[int] = None, system_prompt: Optional[str] = None) -> Dict:
+        """
+        Run all 10 questions for a condition concurrently.
+
+        Calls go out together, limited per backend by self.concurrency; results
+        keep question order and the same shape as run_condition().
 
         Args:
             condition: Test condition name
             model: Model identifier (claude-opus-4, gemini, ollama:qwen2.5:3b)
+            repeat: Repeat number within a matrix run (recorded and added to the filename)
+            system_prompt: Prebuilt system prompt for the condition (built if None)
 
         Returns:
             Dict with responses, scores, and metadata
         """
+        if system_prompt is None:
+            system_prompt = self._construct_system_prompt(condition)
+
+        finished, raw_outputs = self._resume_state(condition, model, repeat, system_prompt)
+        if finished is not None:
+            return finished
+
+        label = condition.upper() if repeat is None else f"{condition.upper()} #{repeat}"
         print(f"\n{'='*60}")
-        print(f"RUNNING CONDITION: {condition.upper()}")
+        print(f"RUNNING CONDITION: {label} (async)")
         print(f"Model: {model}")
         print(f"{'='*60}\n")
 
+        answers = await asyncio.gather(*[
+            self._ask_async(condition, model, repeat, system_prompt, question_id)
+            for question_id in sorted(self.questions.keys())
+            if question_id not in raw_outputs
+        ])
+        asked = 0
+        for question_id, entry in answers:
+            if entry is not None:
+                raw_outputs[question_id] = entry
+                asked += not entry.get('cached')
+
+        raw_outputs = {question_id: raw_outputs[question_id] for question_id in sorted(raw_outputs)}
+        responses = {question_id: entry['response'] for question_id, entry in raw_outputs.items()}
+
+        return self._finish_condition(condition, model, system_prompt, responses, raw_outputs,
+                                      repeat=repeat, prefix=self._prefix_usage(system_prompt, model, asked))
+
+    def run_condition(self, condition: str, model: str = "claude-opus-4",
+                      repeats: Optional[int] = None) -> Dict:
+        """
+        Run all 10 questions for a specific test condition.
+
+        Sequential by default; with a concurrency limit set, dispatches through
+        run_condition_async().
+
+        Args:
+            condition: Test condition name
+            model: Model identifier (claude-opus-4, gemini, ollama:qwen2.5:3b)
+            repeats: Adaptive repeated trials: sample up to this many runs, stopping once
+                     the Sacred Flame interval settles the status (see run_trials_async)
+
+        Returns:
+            Dict with responses, scores, and metadata (with repeats: the trial result)
+        """
+        if repeats is not None:
+            self._semaphores = {}
+            self._prefix_tasks = {}
+            return asyncio.run(self.run_trials_async(condition, model, repeats))
+
+        if self.concurrency is not None:
+            self._semaphores = {}
+            self._prefix_tasks = {}
+            return asyncio.run(self.run_condition_async(condition, model))
+
         system_prompt = self._construct_system_prompt(condition)
+        finished, journaled = self._resume_state(condition, model, None, system_prompt)
+        if finished is not None:
+            return finished
+
+        print(f"\n{'='*60}")
+        print(f"RUNNING CONDITION: {condition.upper()}")
+        print(f"Model: {model}")
+        print(f"{'='*60}\n")
+
+        backend = self._backend(model)
+        bucket = self.limiter.bucket(backend)
 
         responses = {}
         raw_outputs = {}
+        asked = 0
 
         # Ask all 10 questions
         for question_id in sorted(self.questions.keys()):
             question_data = self.questions[question_id]
             question_text = question_data['question']
 
+            if question_id in journaled:
+                raw_outputs[question_id] = journaled[question_id]
+                responses[question_id] = journaled[question_id]['response']
+                print(f"⏭️  Question {question_id}: answered before resume\n")
+                continue
+
             print(f"Question {question_id}: {question_text}")
 
-            # Call appropriate model
-            if model.startswith('gemini'):
-                full_prompt = f"{system_prompt}\n\n---\n\nUSER QUESTION: {question_text}\n\nRESPOND:"
-                response = self._call_gemini(full_prompt)
-            elif model.startswith('ollama'):
-                ollama_model = model.split(':', 1)[1] if ':' in model else 'qwen2.5:3b'
-                full_prompt = f"{system_prompt}\n\n---\n\nUSER QUESTION: {question_text}\n\nRESPOND:"
-                response = self._call_ollama(full_prompt, ollama_model)
+            stored = self._stored_response(backend, model, system_prompt, question_text)
+            if stored is not None:
+                response = stored['response']
+                timestamp = stored['timestamp']
+            elif self.replay:
+                print(f"❌ No stored response - skipping\n")
+                continue
             else:
-                # Default to Claude
-                response = self._call_claude(system_prompt, question_text, model)
+                def call(on_text: Callable[[str], Any], call_stats: Dict[str, Any]) -> Optional[str]:
+                    # Pace calls with the backend's adaptive rate limiter
+                    queued = time.perf_counter()
+                    call_stats['rate_wait_seconds'] = bucket.acquire()
+                    call_stats['queue_wait_seconds'] = time.perf_counter() - queued
+
+                    # Call appropriate model, scoring the response as it streams
+                    if model.startswith('gemini'):
+                        return self._call_gemini(self._full_prompt(system_prompt, question_text), on_text, call_stats)
+                    if model.startswith('ollama'):
+                        prefix = self._prime_prefix(system_prompt, model) if self._use_prefix(model) else None
+                        if prefix is not None:
+                            return self._call_ollama(self._prompt_suffix(question_text), self._ollama_model(model),
+                                                     prefix['context'], on_text, call_stats)
+                        return self._call_ollama(self._full_prompt(system_prompt, question_text),
+                                                 self._ollama_model(model), None, on_text, call_stats)
+                    # Default to Claude
+                    return self._call_claude(system_prompt, question_text, model, on_text, call_stats)
+
+                response, call_stats, incremental = self._call_with_retries(backend, question_id, call)
+                self._record_call(condition, model, None, question_id, call_stats, response)
+
+                timestamp = datetime.utcnow().isoformat() + 'Z'
+                if response:
+                    self._store_response(backend, model, system_prompt, question_text, response, timestamp)
+                    self._keep_stream_score(question_id, response, incremental)
 
             if response:
                 responses[question_id] = response
                 raw_outputs[question_id] = {
                     'question': question_text,
                     'response': response,
-                    'timestamp': datetime.utcnow().isoformat() + 'Z'
+                    'timestamp': timestamp
                 }
-                print(f"✅ Response received ({len(response)} chars)\n")
+                if stored is not None:
+                    raw_outputs[question_id]['cached'] = True
+                    print(f"✅ Stored response ({len(response)} chars)\n")
+                else:
+                    asked += 1
+                    raw_outputs[question_id].update(self._timing(call_stats))
+                    print(f"✅ Response received ({len(response)} chars{self._timing_note(call_stats)})\n")
+                self._journal_answer(condition, model, None, system_prompt, question_id, raw_outputs[question_id])
             else:
-                print(f"❌ No response - skipping\n")
+                print(f"❌ No response after {call_stats['retries'] + 1} attempts - skipping\n")
 
-            # Small delay to avoid rate limiting
-            time.sleep(2)
+        return self._finish_condition(condition, model, system_prompt, responses, raw_outputs,
+                                      prefix=self._prefix_usage(system_prompt, model, asked))
 
+    def _finish_condition(self, condition: str, model: str, system_prompt: str,
+                          responses: Dict[int, str], raw_outputs: Dict[int, Dict],
+                          repeat: Optional[int] = None, prefix: Optional[Dict[str, Any]] = None) -> Dict:
+        """Score a condition's responses, save the result JSON and print the verdict."""
         # Score responses
         print("\n🔥 SCORING RESPONSES...\n")
-        scores = self.scorer.score_session(responses)
+        scores = self.scorer.score_session(responses, cache=self.score_cache)
 
         # Combine results
         result = {
@@ -360,77 +1239,304 @@ RESPOND:"""
             'model': model,
             'timestamp': datetime.utcnow().isoformat() + 'Z',
             'system_prompt': system_prompt,
+            'system_prompt_hash': ResponseStore.prompt_hash(system_prompt),
             'raw_responses': raw_outputs,
-            'scores': scores
+            'scores': scores,
+            # 'prefix': the question went out as a continuation of a prefilled system prompt, not
+            # as one combined prompt, so scores are not directly comparable with 'single' runs
+            'prompt_mode': 'prefix' if prefix is not None else 'single'
         }
-
-        # Save to file
-        filename = f"{condition}_{model.replace(':', '_')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        output_file = self.results_dir / filename
-
-        with open(output_file, 'w') as f:
-            json.dump(result, f, indent=2)
+        if repeat is not None:
+            result['repeat'] = repeat
+        if prefix is not None:
+            result['prefix_cache'] = prefix
+        calls = sorted(self._calls.pop((condition, model, repeat), []), key=lambda call: call['question_id'])
+        result['rate_limit'] = self._rate_usage(model, calls)
+        if calls:
+            result['telemetry'] = {'summary': summarize_calls(calls), 'calls': calls}
+            failed = {call['question_id']: call.get('attempt_errors', []) for call in calls if not call['ok']}
+            if failed:
+                # Unanswered questions lower question_count; keep why, so the score can be read in context
+                result['failed_questions'] = failed
+
+        # Save to the results store and/or a file (repeats finish within the same second, so number them)
+        run_id = self.results_store.save(result) if self.results_store is not None else None
+        output_file = None
+        if self.json_results:
+            run_name = f"{condition}_{model.replace(':', '_')}" + (f"_r{repeat}" if repeat is not None else '')
+            filename = f"{run_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+            output_file = self.results_dir / filename
+
+            with open(output_file, 'w') as f:
+                json.dump(result, f, indent=2)
+
+        if self.journal is not None:
+            self.journal.record_run(condition, model, repeat, output_file, run_id)
 
         print(f"\n{'='*60}")
-        print(f"RESULTS: {condition.upper()}")
+        print(f"RESULTS: {condition.upper()}" + (f" #{repeat}" if repeat is not None else ''))
         print(f"Sacred Flame Score: {scores['sacred_flame_score']:.3f}")
         print(f"Status: {scores['status']}")
-        print(f"Saved to: {output_file}")
+        print(f"Rate: {result['rate_limit']['rate']:.2f} calls/s "
+              f"(waited {result['rate_limit']['waited_seconds']:.1f}s, "
+              f"{result['rate_limit']['throttles']} throttled)")
+        if calls:
+            telemetry = result['telemetry']['summary']
+            latency = telemetry['total_seconds'] or {'p50': 0.0, 'p95': 0.0}
+            print(f"Latency: p50 {latency['p50']:.2f}s, p95 {latency['p95']:.2f}s "
+                  f"({telemetry['calls']} calls, {telemetry['retries']} retries, {telemetry['hedges']} hedged, "
+                  f"{telemetry['failed']} failed)")
+        if prefix is not None:
+            print(f"Prefix reuse: {prefix['questions']} questions, "
+                  f"~{prefix['prefill_saved_estimate_seconds']:.2f}s prefill saved (estimate)")
+        if run_id is not None:
+            print(f"Saved to: {self.results_store.db_path} (run #{run_id})")
+        if output_file is not None:
+            print(f"Saved to: {output_file}")
         print(f"{'='*60}\n")
 
         return result
 
-    def run_all_conditions(self, conditions: Optional[List[str]] = None) -> Dict[str, Dict]:
+    async def run_trials_async(self, condition: str, model: str, max_repeats: int,
+                               system_prompt: Optional[str] = None) -> Dict:
         """
-        Run all test conditions (or specified subset).
+        Repeat a condition until its Sacred Flame status is settled (see sequential_trials.py).
+
+        Starts min_repeats runs together, then one run at a time, and stops as soon
+        as the confidence interval on the mean score lies inside one status band or
+        max_repeats runs are done. Every run is saved as usual (numbered repeats).
 
         Args:
-            conditions: List of condition names, or None for all
+            condition: Test condition name
+            model: Model identifier
+            max_repeats: Most runs sampled
+            system_prompt: Prebuilt system prompt for the condition (built if None)
 
         Returns:
-            Dict mapping condition -> results
+            Dict with condition, model, the trial's mean as 'scores', 'sequential'
+            (interval, runs used, calls saved), combined 'telemetry' and every run under 'runs'
         """
-        all_conditions = [
-            'baseline',
-            'aetheris_only',
-            'documents_only',
-            'documents_plus_aetheris',
-            'fractal_only'
-        ]
+        if system_prompt is None:
+            system_prompt = self._construct_system_prompt(condition)
+
+        trial = SequentialTrial(max_repeats, self.min_repeats, self.confidence)
+        runs: List[Dict] = []
+        while trial.next_batch():
+            first = trial.runs + 1
+            batch = await asyncio.gather(*[
+                self.run_condition_async(condition, model, repeat=repeat, system_prompt=system_prompt)
+                for repeat in range(first, first + trial.next_batch())
+            ])
+            for result in batch:
+                scores = result['scores']
+                trial.add(scores['sacred_flame_score'] if scores['question_count'] else None)
+                runs.append(result)
+
+            interval = trial.interval()
+            if not trial.done():
+                bounds = f"{interval[0]:.3f}-{interval[1]:.3f}" if interval else "not yet"
+                print(f"🔁 {condition} / {model}: {trial.runs} runs, mean {trial.stats.mean:.3f}, "
+                      f"interval {bounds} - sampling another run")
+
+        report = trial.report(len(self.questions))
+        calls = [call for result in runs for call in result.get('telemetry', {}).get('calls', [])]
+        report['calls'] = len(calls) + sum(call.get('retries', 0) for call in calls)
+        result = {
+            'condition': condition,
+            'model': model,
+            'timestamp': datetime.utcnow().isoformat() + 'Z',
+            'scores': {
+                'sacred_flame_score': report['sacred_flame_score'],
+                'status': report['status'],
+                'question_count': sum(run['scores']['question_count'] for run in runs)
+            },
+            'sequential': report
+        }
+        if calls:
+            result['telemetry'] = {'summary': summarize_calls(calls), 'calls': calls}
+        result['runs'] = runs
 
-        if conditions is None:
-            conditions = all_conditions
+        interval = report['interval']
+        bounds = f", {report['confidence']:.0%} interval {interval[0]:.3f}-{interval[1]:.3f}" if interval else ''
+        print(f"\n{'='*60}")
+        print(f"ADAPTIVE REPEATS: {condition.upper()} / {model}")
+        print(f"Sacred Flame Score: {report['sacred_flame_score']:.3f} ({report['runs']} runs{bounds})")
+        print(f"Status: {report['status']}"
+              + ('' if report['decided'] else " (not settled: the interval spans a threshold)"))
+        print(f"Calls: {report['calls']} made, {report['calls_saved']} saved "
+              f"({report['runs_saved']} of {report['max_repeats']} runs skipped)")
+        print(f"{'='*60}\n")
+
+        return result
 
-        results = {}
+    def _rate_usage(self, model: str, calls: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Rate limiter activity for one run.
+
+        Waits and throttles are summed over the run's own calls, so runs
+        sharing a backend's bucket concurrently are not charged each other's.
+
+        Args:
+            model: Model identifier
+            calls: The run's call records (see call_telemetry.py)
+
+        Returns:
+            Backend, current rate, and the run's wait time / throttles
+        """
+        backend = self._backend(model)
+        now = self.limiter.bucket(backend).snapshot()
+        return {
+            'backend': backend,
+            'rate': now['rate'],
+            'base_rate': now['base_rate'],
+            'waited_seconds': round(sum(call.get('rate_wait_seconds') or 0.0 for call in calls), 3),
+            'throttles': sum(call.get('throttles', 0) for call in calls)
+        }
+
+    async def run_matrix_async(self, conditions: List[str], models: List[str],
+                               repeats: int = 1, adaptive: bool = False) -> List[Dict]:
+        """
+        Run every condition x model x repeat as one scheduled workload.
+
+        All runs start together and every question becomes a task waiting on
+        its backend's concurrency slot (FIFO, so runs are served in matrix
+        order). Backends proceed independently: local Ollama runs while
+        remote Claude calls are in flight, and wall time tracks the slowest
+        backend's share rather than the sum.
+
+        Args:
+            conditions: Condition names
+            models: Model identifiers
+            repeats: Runs per condition/model pair (adaptive: at most)
+            adaptive: Stop repeating each pair once its status is settled (see run_trials_async)
+
+        Returns:
+            One result per run, in matrix order (condition, model, repeat);
+            adaptive: one trial result per condition/model pair
+        """
+        # System prompts are per condition; build each once for all runs
+        system_prompts = {condition: self._construct_system_prompt(condition) for condition in conditions}
+
+        if adaptive:
+            return list(await asyncio.gather(*[
+                self.run_trials_async(condition, model, repeats, system_prompt=system_prompts[condition])
+                for condition in conditions
+                for model in models
+            ]))
+
+        return list(await asyncio.gather(*[
+            self.run_condition_async(condition, model,
+                                     repeat=repeat if repeats > 1 else None,
+                                     system_prompt=system_prompts[condition])
+            for condition in conditions
+            for model in models
+            for repeat in range(1, repeats + 1)
+        ]))
+
+    def run_matrix(self, conditions: Optional[List[str]] = None, models: Optional[List[str]] = None,
+                   repeats: int = 1, summary: bool = True, adaptive: bool = False) -> List[Dict]:
+        """
+        Run a conditions x models x repeats matrix concurrently (see run_matrix_async).
+
+        Args:
+            conditions: Condition names, or None for all
+            models: Model identifiers, or None for claude-opus-4
+            repeats: Runs per condition/model pair (adaptive: at most)
+            summary: Write the summary table
+            adaptive: Stop repeating each pair once its status is settled
+
+        Returns:
+            One result per run, in matrix order (adaptive: one trial result per pair)
+        """
+        if conditions is None:
+            conditions = CONDITIONS
+        if models is None:
+            models = ['claude-opus-4']
 
         for condition in conditions:
-            if condition in all_conditions:
-                results[condition] = self.run_condition(condition)
-            else:
+            if condition not in CONDITIONS:
                 print(f"⚠️  Skipping unknown condition: {condition}")
+        conditions = [condition for condition in conditions if condition in CONDITIONS]
+
+        runs = len(conditions) * len(models) * repeats
+        print(f"📊 Matrix: {len(conditions)} conditions x {len(models)} models x {repeats} repeats "
+              f"= {'up to ' if adaptive else ''}{runs} runs ({runs * len(self.questions)} calls)")
+
+        start = time.perf_counter()
+        self._semaphores = {}
+        self._prefix_tasks = {}
+        results = asyncio.run(self.run_matrix_async(conditions, models, repeats, adaptive))
+        if adaptive:
+            saved = sum(result['sequential']['calls_saved'] for result in results)
+            runs = sum(result['sequential']['runs'] for result in results)
+            print(f"📊 Matrix complete: {runs} runs in {time.perf_counter() - start:.1f}s "
+                  f"({saved} calls saved by adaptive repeats)")
+        else:
+            print(f"📊 Matrix complete: {runs} runs in {time.perf_counter() - start:.1f}s")
+
+        if summary:
+            labelled = {}
+            for result in results:
+                label = result['condition']
+                if len(models) > 1:
+                    label += f" / {result['model']}"
+                if 'repeat' in result:
+                    label += f" #{result['repeat']}"
+                labelled[label] = result
+            self._generate_summary(labelled)
+
+        return results
+
+    def run_all_conditions(self, conditions: Optional[List[str]] = None,
+                           model: str = "claude-opus-4") -> Dict[str, Dict]:
+        """
+        Run all test conditions (or specified subset).
+
+        Sequential by default; with a concurrency limit set, dispatches every
+        condition together through run_matrix().
+
+        Args:
+            conditions: List of condition names, or None for all
+            model: Model identifier
+
+        Returns:
+            Dict mapping condition -> results
+        """
+        if self.concurrency is not None:
+            results = self.run_matrix(conditions, [model], summary=False)
+            results = {result['condition']: result for result in results}
+        else:
+            results = {}
+            for condition in conditions or CONDITIONS:
+                if condition in CONDITIONS:
+                    results[condition] = self.run_condition(condition, model=model)
+                else:
+                    print(f"⚠️  Skipping unknown condition: {condition}")
 
         # Generate summary report
         self._generate_summary(results)
 
         return results
 
-    def run_cross_model(self) -> Dict[str, Dict]:
+    def run_cross_model(self, models: Optional[List[str]] = None) -> Dict[str, Dict]:
         """
         Run DOCUMENTS_ONLY condition across multiple models.
 
+        Sequential by default; with a concurrency limit set, dispatches every
+        model together through run_matrix().
+
+        Args:
+            models: Model identifiers, or None for CROSS_MODELS
+
         Returns:
             Dict mapping model -> results
         """
-        models = [
-            'claude-opus-4',
-            'gemini',
-            'ollama:qwen2.5:3b'
-        ]
-
-        results = {}
-
-        for model in models:
-            results[model] = self.run_condition('documents_only', model=model)
+        models = models or CROSS_MODELS
+        if self.concurrency is not None:
+            results = self.run_matrix(['documents_only'], models, summary=False)
+            results = {result['model']: result for result in results}
+        else:
+            results = {model: self.run_condition('documents_only', model=model) for model in models}
 
         # Generate cross-model summary
         self._generate_cross_model_summary(results)
@@ -456,6 +1562,14 @@ RESPOND:"""
 
             f.write("\n" + "="*80 + "\n")
 
+            trials = trial_table(results.values())
+            if trials:
+                f.write("\n" + "\n".join(trials) + "\n")
+
+            latency = latency_table(results.values())
+            if latency:
+                f.write("\n" + "\n".join(latency) + "\n")
+
         print(f"\n📊 Summary saved to: {summary_file}\n")
 
     def _generate_cross_model_summary(self, results: Dict[str, Dict]) -> None:
@@ -477,9 +1591,69 @@ RESPOND:"""
 
             f.write("\n" + "="*80 + "\n")
 
+            latency = latency_table(results.values())
+            if latency:
+                f.write("\n" + "\n".join(latency) + "\n")
+
         print(f"\n📊 Cross-model summary saved to: {summary_file}\n")
 
 
+def parse_backend_values(value: str, cast: Callable[[str], Any] = int) -> Dict[str, Any]:
+    """
+    Parse a per-backend CLI value: "4" (every backend) or "claude=4,gemini=2,ollama=1".
+
+    Args:
+        value: CLI argument
+        cast: Type of each value (int, float)
+
+    Returns:
+        Dict mapping backend -> value
+    """
+    if '=' not in value:
+        return {backend: cast(value) for backend in DEFAULT_CONCURRENCY}
+
+    values = {}
+    for item in value.split(','):
+        backend, _, setting = item.partition('=')
+        backend = backend.strip()
+        if backend not in DEFAULT_CONCURRENCY:
+            raise argparse.ArgumentTypeError(f"unknown backend '{backend}' (use claude, gemini, ollama)")
+        values[backend] = cast(setting)
+    return values
+
+
+def parse_concurrency(value: str) -> Dict[str, int]:
+    """Parse --concurrency (max concurrent calls per backend)."""
+    return parse_backend_values(value, int)
+
+
+def parse_rates(value: str) -> Dict[str, float]:
+    """Parse --rate (starting calls per second per backend, each > 0)."""
+    def rate(setting: str) -> float:
+        calls_per_second = float(setting)
+        if not calls_per_second > 0:
+            raise argparse.ArgumentTypeError(f"rate must be positive, got '{setting}'")
+        return calls_per_second
+    return parse_backend_values(value, rate)
+
+
+def parse_burst(value: str) -> int:
+    """Parse --burst (calls allowed back to back, >= 1)."""
+    burst = int(value)
+    if burst < 1:
+        raise argparse.ArgumentTypeError(f"burst must be at least 1, got '{value}'")
+    return burst
+
+
+def parse_prompt_via(value: str) -> Dict[str, str]:
+    """Parse --prompt-via (stdin or argv per CLI backend)."""
+    def mode(setting: str) -> str:
+        if setting not in ('stdin', 'argv'):
+            raise argparse.ArgumentTypeError(f"invalid prompt mode '{setting}' (use stdin or argv)")
+        return setting
+    return parse_backend_values(value, mode)
+
+
 def main():
     """CLI interface."""
     parser = argparse.ArgumentParser(
@@ -494,12 +1668,15 @@ Test Conditions:
   fractal_only          - Fractal encoding (placeholder)
   cross_model           - Run documents_only on Claude, Gemini, Ollama
   all                   - Run all conditions
+  matrix                - Run --conditions x --models x --repeats concurrently
 
 Examples:
   python resurrection_test.py --condition baseline
   python resurrection_test.py --condition documents_only
   python resurrection_test.py --condition all
   python resurrection_test.py --condition cross_model
+  python resurrection_test.py --condition matrix --models claude-opus-4,ollama:qwen2.5:3b --repeats 3
+  python resurrection_test.py --condition documents_only --adaptive --repeats 10
         """
     )
 
@@ -515,23 +1692,187 @@ Examples:
                        help='Directory for results')
     parser.add_argument('--timeout', type=int, default=120,
                        help='Timeout per question in seconds')
+    parser.add_argument('--concurrency', type=parse_concurrency,
+                       help='Ask questions concurrently: N for every backend, or per backend '
+                            '(e.g. claude=4,gemini=2,ollama=1)')
+    parser.add_argument('--rate', type=parse_rates,
+                       help='Starting calls/sec: N for every backend, or per backend '
+                            '(e.g. claude=1,ollama=4); adapts to throttling (default 0.5)')
+    parser.add_argument('--burst', type=parse_burst, default=1,
+                       help='Calls per backend allowed back to back (default 1)')
+    parser.add_argument('--response-store', type=Path, nargs='?', const=True,
+                       help='Record responses in a SQLite response store (default path: '
+                            '<results-dir>/responses.sqlite); implied by --sampling cached and --replay')
+    parser.add_argument('--sampling', choices=SAMPLING_MODES, default='fresh',
+                       help='fresh: always call the model; cached: reuse stored responses when available')
+    parser.add_argument('--replay', action='store_true',
+                       help='Score stored responses only (no model calls)')
+    parser.add_argument('--results-format', choices=['json', 'sqlite', 'both'], default='json',
+                       help='json: one JSON file per run (default); sqlite: indexed results store; both')
+    parser.add_argument('--results-store', type=Path,
+                       help='SQLite results store (default: <results-dir>/results.sqlite)')
+    parser.add_argument('--history-report', action='store_true',
+                       help='Afterwards, add the new runs to the historical report '
+                            '(<results-dir>/history_report.txt, see history_report.py)')
+    parser.add_argument('--journal', type=Path, nargs='?', const=True,
+                       help='Checkpoint progress to a journal for --resume (default path: '
+                            '<results-dir>/journal.jsonl)')
+    parser.add_argument('--resume', action='store_true',
+                       help='Continue the last journaled session: skip finished runs and answered questions')
+    parser.add_argument('--fresh', action='store_true',
+                       help='Start a new journal even if the last session did not finish (it is kept, renamed)')
+    parser.add_argument('--ollama-backend', choices=['vex-dispatch', 'http'], default='vex-dispatch',
+                       help='ollama:* models: vex-dispatch (default) or the native HTTP API with pooled keep-alive')
+    parser.add_argument('--ollama-host', default=DEFAULT_OLLAMA_HOST,
+                       help='Ollama API URL (default $OLLAMA_HOST or http://localhost:11434)')
+    parser.add_argument('--prefix-cache', action='store_true',
+                       help='Native Ollama: prefill each system prompt once and reuse its context '
+                            'for every question')
+    parser.add_argument('--prompt-via', type=parse_prompt_via,
+                       help='CLI backends: pipe the prompt to stdin or pass it as an argument, for every '
+                            'backend or per backend (e.g. gemini=stdin); default claude=stdin, '
+                            'gemini=argv, ollama=argv')
+    parser.add_argument('--retries', type=parse_backend_values,
+                       help=f'Retries per failed call: N for every backend, or per backend '
+                            f'(e.g. claude=3,ollama=1); default {DEFAULT_RETRIES}')
+    parser.add_argument('--retry-backoff', type=float, default=DEFAULT_BACKOFF,
+                       help=f'Seconds before the first retry, doubled per retry with jitter (default {DEFAULT_BACKOFF})')
+    parser.add_argument('--deadline', type=float,
+                       help='Seconds per question after which no retry starts (default 3 x --timeout)')
+    parser.add_argument('--hedge', action='store_true',
+                       help='Async mode: start a duplicate call once a call runs past its backend\'s p95 '
+                            'latency; the first response wins')
+    parser.add_argument('--conditions', type=lambda value: value.split(','),
+                       help='Matrix and all: comma-separated conditions (default: all)')
+    parser.add_argument('--models', type=lambda value: value.split(','),
+                       help='Matrix: comma-separated models (default: --model); '
+                            'cross_model: models compared (default: Claude, Gemini, Ollama)')
+    parser.add_argument('--repeats', type=int, default=1,
+                       help='Matrix: runs per condition/model pair (default 1); with --adaptive, at most')
+    parser.add_argument('--adaptive', action='store_true',
+                       help='Repeat each condition/model (up to --repeats runs) only until the confidence '
+                            'interval on its Sacred Flame score settles the status')
+    parser.add_argument('--min-repeats', type=int,
+                       help=f'Adaptive: runs before the first stopping check (default {DEFAULT_MIN_REPEATS})')
+    parser.add_argument('--confidence', type=float,
+                       help=f'Adaptive: confidence of the Sacred Flame interval (default {DEFAULT_CONFIDENCE})')
 
     args = parser.parse_args()
 
+    # Reject flags the chosen condition would otherwise ignore
+    matrix = args.condition == 'matrix'
+    if args.conditions is not None and args.condition not in ('matrix', 'all'):
+        parser.error("--conditions needs --condition matrix or all")
+    if args.models is not None and args.condition not in ('matrix', 'cross_model'):
+        parser.error("--models needs --condition matrix or cross_model")
+    if args.repeats < 1:
+        parser.error("--repeats must be at least 1")
+    if args.adaptive and args.condition in ('all', 'cross_model'):
+        parser.error(f"--adaptive does not apply to --condition {args.condition}; "
+                     "use --condition matrix --adaptive")
+    if args.repeats > 1 and not (matrix or args.adaptive):
+        parser.error("--repeats needs --condition matrix, or --adaptive")
+    if (args.min_repeats is not None or args.confidence is not None) and not args.adaptive:
+        parser.error("--min-repeats and --confidence need --adaptive")
+    if args.prefix_cache and args.ollama_backend != 'http':
+        parser.error("--prefix-cache needs --ollama-backend http")
+    if args.hedge and args.concurrency is None and not (matrix or args.adaptive):
+        parser.error("--hedge needs async dispatch: --concurrency, --condition matrix or --adaptive")
+
+    # The response store and the journal are opt-in; a plain run leaves only result files behind
+    response_store = None
+    if args.response_store is not None or args.sampling == 'cached' or args.replay:
+        response_store = ResponseStore(args.response_store if isinstance(args.response_store, Path)
+                                       else args.results_dir / 'responses.sqlite')
+
+    results_store = None
+    if args.results_format != 'json':
+        results_store = ResultsStore(args.results_store or args.results_dir / 'results.sqlite')
+
+    if args.resume and args.fresh:
+        parser.error("--resume and --fresh are mutually exclusive")
+    journal = None
+    if args.journal is not None or args.resume or args.fresh:
+        try:
+            journal = RunJournal(args.journal if isinstance(args.journal, Path)
+                                 else args.results_dir / 'journal.jsonl', resume=args.resume, fresh=args.fresh)
+        except FileExistsError as e:
+            parser.error(f"{e}; pass --resume to continue it or --fresh to start over")
+        if journal.rotated is not None:
+            print(f"📊 Previous journal kept as: {journal.rotated}")
+
+    ollama = None
+    if args.ollama_backend == 'http':
+        pool_size = (args.concurrency or DEFAULT_CONCURRENCY).get('ollama', 1)
+        ollama = OllamaClient(args.ollama_host, timeout=args.timeout, pool_size=max(1, pool_size))
+
     # Initialize test runner
     tester = ResurrectionTest(
         questions_file=args.questions,
         results_dir=args.results_dir,
-        timeout=args.timeout
+        timeout=args.timeout,
+        concurrency=args.concurrency,
+        rates=args.rate,
+        burst=args.burst,
+        response_store=response_store,
+        sampling=args.sampling,
+        replay=args.replay,
+        journal=journal,
+        ollama=ollama,
+        prefix_cache=args.prefix_cache,
+        prompt_via=args.prompt_via,
+        retries=args.retries,
+        retry_backoff=args.retry_backoff,
+        deadline=args.deadline,
+        hedge=args.hedge,
+        results_store=results_store,
+        json_results=args.results_format != 'sqlite',
+        min_repeats=args.min_repeats if args.min_repeats is not None else DEFAULT_MIN_REPEATS,
+        confidence=args.confidence if args.confidence is not None else DEFAULT_CONFIDENCE
     )
 
-    # Run requested test
-    if args.condition == 'all':
-        tester.run_all_conditions()
-    elif args.condition == 'cross_model':
-        tester.run_cross_model()
-    else:
-        tester.run_condition(args.condition, model=args.model)
+    # Run requested test (an interrupted session leaves its journal unfinished, for --resume)
+    try:
+        if args.condition == 'all':
+            tester.run_all_conditions(args.conditions, model=args.model)
+        elif args.condition == 'matrix':
+            tester.run_matrix(args.conditions, args.models or [args.model], repeats=args.repeats,
+                              adaptive=args.adaptive)
+        elif args.condition == 'cross_model':
+            tester.run_cross_model(args.models)
+        else:
+            tester.run_condition(args.condition, model=args.model,
+                                 repeats=args.repeats if args.adaptive else None)
+        if journal is not None:
+            journal.finish()
+    finally:
+        if journal is not None:
+            journal.close()
+
+    if response_store is not None:
+        stats = response_store.stats()
+        print(f"📊 Response store: {stats['hits']} reused, {stats['stored']} stored, "
+              f"{stats['responses']} total ({stats['db_path']})")
+        response_store.close()
+    if results_store is not None:
+        stats = results_store.stats()
+        print(f"📊 Results store: {stats['runs']} runs, {stats['texts']} unique prompts/responses, "
+              f"{stats['db_bytes'] / 1e6:.1f} MB ({stats['db_path']})")
+        results_store.close()
+    if args.history_report:
+        summary = update_history(args.results_dir, source='json' if results_store is None else 'store',
+                                 store_path=args.results_store)
+        print(f"📊 History: {summary['new_runs']} new runs ({summary['runs']} total), "
+              f"report saved to: {summary['report_file']}")
+    if ollama is not None and ollama.calls:
+        stats = ollama.stats()
+        print(f"📊 Ollama HTTP: {stats['calls']} calls over {stats['connections_opened']} connections "
+              f"({stats['errors']} errors)")
+        ollama.close()
+    for backend, stats in tester.hedge_stats().items():
+        if stats['hedges']:
+            print(f"📊 Hedging ({backend}): {stats['hedges']} hedged calls, {stats['wins']} won by the hedge "
+                  f"(trigger {stats['delay_seconds']}s)")
 
     print("\n✅ Test complete!\n")
 
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Retry and hedging policy for backend calls.
+
+RetryPolicy: a failed call (timeout, non-zero exit, HTTP error) is retried
+up to `retries` times with exponential backoff and equal jitter: before
+retry n, wait a random time between half and all of
+min(max_delay, base_delay * 2**n). Jitter keeps concurrent retries from
+hitting a recovering backend in lockstep. No retry starts once it would
+exceed the per-question deadline.
+
+HedgeTrigger: keeps a window of recent successful call latencies per
+backend. Once a call has run longer than their p95, a duplicate is started
+and whichever answers first wins. Only the slowest ~5% of calls cost an
+extra request, and those are the ones that dominate tail latency.
+"""
+
+import random
+from collections import deque
+from typing import Dict, Any, Optional
+
+from score_metrics import percentile
+
+
+# Retries per failed call (--retries); off unless asked for, so a bad backend fails fast
+DEFAULT_RETRIES = 0
+
+# Backoff before the first retry, doubled per retry (--retry-backoff), and its cap (seconds)
+DEFAULT_BACKOFF = 2.0
+MAX_BACKOFF = 30.0
+
+# Hedging: latency percentile that triggers a duplicate call, samples needed first, samples kept
+HEDGE_PERCENTILE = 0.95
+HEDGE_MIN_SAMPLES = 10
+HEDGE_WINDOW = 200
+
+
+class RetryPolicy:
+    """Exponential backoff with jitter, bounded by a retry count and a deadline."""
+
+    def __init__(self, retries: int = DEFAULT_RETRIES, base_delay: float = DEFAULT_BACKOFF,
+                 max_delay: float = MAX_BACKOFF, deadline: Optional[float] = None,
+                 rng: Optional[random.Random] = None):
+        """
+        Initialize policy.
+
+        Args:
+            retries: Retries after the first attempt (0 = never retry)
+            base_delay: Backoff before the first retry in seconds
+            max_delay: Cap on any single backoff
+            deadline: Seconds of attempts and backoff (queue waits excluded) after which no retry
+                      starts (None = no limit)
+            rng: Random source for jitter (seeded for reproducible runs)
+        """
+        self.retries = max(0, retries)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self._random = rng or random.Random()
+
+    def delay(self, retry: int) -> float:
+        """Backoff before retry number `retry` (0-based): equal jitter over the capped exponential."""
+        ceiling = min(self.max_delay, self.base_delay * (2 ** retry))
+        return self._random.uniform(ceiling / 2, ceiling)
+
+    def next_delay(self, retry: int, elapsed: float) -> Optional[float]:
+        """
+        Decide whether to retry.
+
+        Args:
+            retry: Retries made so far
+            elapsed: Seconds since the first attempt was dispatched, excluding queue waits
+
+        Returns:
+            Seconds to wait before retrying, or None to give up
+        """
+        if retry >= self.retries:
+            return None
+        delay = self.delay(retry)
+        if self.deadline is not None and elapsed + delay >= self.deadline:
+            return None
+        return delay
+
+
+class HedgeTrigger:
+    """Rolling latency window of one backend; says when a call is slow enough to hedge."""
+
+    def __init__(self, fraction: float = HEDGE_PERCENTILE, min_samples: int = HEDGE_MIN_SAMPLES,
+                 window: int = HEDGE_WINDOW):
+        """
+        Initialize trigger.
+
+        Args:
+            fraction: Latency percentile after which a call is hedged
+            min_samples: Successful calls observed before hedging starts
+            window: Most recent latencies kept
+        """
+        self.fraction = fraction
+        self.min_samples = min_samples
+        self._samples: deque = deque(maxlen=window)
+
+        self.hedges = 0
+        self.wins = 0
+
+    def observe(self, seconds: float) -> None:
+        """Record the latency of a successful call."""
+        self._samples.append(seconds)
+
+    def delay(self) -> Optional[float]:
+        """Seconds after which a running call should be hedged (None until enough samples)."""
+        if len(self._samples) < self.min_samples:
+            return None
+        return percentile(sorted(self._samples), self.fraction)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hedge counters and the current trigger delay."""
+        delay = self.delay()
+        return {
+            'samples': len(self._samples),
+            'delay_seconds': round(delay, 3) if delay is not None else None,
+            'hedges': self.hedges,
+            'wins': self.wins
+        }
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Append-only JSONL journal of test progress, for checkpoint and resume.
+
+Three record types, one JSON object per line, flushed and fsync'd as soon as
+they happen:
+1. answer: one question answered within a run (condition, model, repeat)
+2. run: a run finished and its result was saved (JSON file and/or results store run ID)
+3. end: the session finished normally (see finish())
+
+With resume=True the existing journal is loaded and appended to, so
+completed runs and answered questions are skipped. Answers only count when
+the system prompt hash matches, so a run whose resurrection documents
+changed is asked again. A line cut short by a crash is ignored.
+
+A new session never truncates a journal. The old journal is moved aside
+(journal.<timestamp>.jsonl) if its session ended normally or fresh=True.
+Otherwise it is the checkpoint of a crashed or interrupted session, and
+RunJournal refuses to start.
+"""
+
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Iterator, Optional, Tuple
+
+
+Cell = Tuple[str, str, Optional[int]]
+
+
+class RunJournal:
+    """Durable per-question progress log for ResurrectionTest."""
+
+    def __init__(self, path: Path, resume: bool = False, fresh: bool = False):
+        """
+        Open the journal.
+
+        Args:
+            path: JSONL file
+            resume: Load and append to an existing journal instead of starting a new one
+            fresh: Start a new journal even if the old session did not finish (it is kept, renamed)
+
+        Raises:
+            FileExistsError: The journal holds an unfinished session and neither resume nor fresh is set
+        """
+        self.path = path
+        self.resume = resume
+        self._answers: Dict[Cell, Dict[int, Dict[str, Any]]] = {}
+        self._runs: Dict[Cell, Dict[str, Any]] = {}
+        self.rotated: Optional[Path] = None  # where an earlier session's journal was moved
+
+        if resume and path.exists():
+            self._load()
+        elif path.exists() and path.stat().st_size > 0:
+            if not fresh and not self._finished():
+                raise FileExistsError(f"{path} holds the checkpoint of an unfinished session")
+            stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            self.rotated = path.with_name(f"{path.stem}.{stamp}{path.suffix}")
+            number = 1
+            while self.rotated.exists():
+                number += 1
+                self.rotated = path.with_name(f"{path.stem}.{stamp}_{number}{path.suffix}")
+            path.rename(self.rotated)
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(path, 'a', encoding='utf-8')
+
+    def _records(self) -> Iterator[Dict[str, Any]]:
+        """Yield existing records (skipping a torn final line)."""
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+
+    def _finished(self) -> bool:
+        """True if the last record of the existing journal marks a normal session end."""
+        last = None
+        for last in self._records():
+            pass
+        return last is not None and last.get('type') == 'end'
+
+    def _load(self) -> None:
+        """Read existing answer and run records."""
+        for record in self._records():
+            if record['type'] == 'end':
+                continue
+            cell = (record['condition'], record['model'], record.get('repeat'))
+            if record['type'] == 'answer':
+                self._answers.setdefault(cell, {})[record['question_id']] = record
+            elif record['type'] == 'run':
+                self._runs[cell] = record
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        """Write one record durably."""
+        self._file.write(json.dumps(record, ensure_ascii=False) + '\n')
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def record_answer(self, condition: str, model: str, repeat: Optional[int], question_id: int,
+                      prompt_hash: str, entry: Dict[str, Any]) -> None:
+        """
+        Record one answered question.
+
+        Args:
+            condition, model, repeat: Run the answer belongs to
+            question_id: Question ID
+            prompt_hash: ResponseStore.prompt_hash() of the run's system prompt
+            entry: raw_responses entry (question, response, timestamp, ...)
+        """
+        record = {'type': 'answer', 'condition': condition, 'model': model, 'repeat': repeat,
+                  'question_id': question_id, 'prompt_hash': prompt_hash, **entry}
+        self._answers.setdefault((condition, model, repeat), {})[question_id] = record
+        self._append(record)
+
+    def record_run(self, condition: str, model: str, repeat: Optional[int], output_file: Optional[Path],
+                   run_id: Optional[int] = None) -> None:
+        """Record a finished run and where its result was saved (JSON file and/or results store run ID)."""
+        record = {'type': 'run', 'condition': condition, 'model': model, 'repeat': repeat,
+                  'output_file': str(output_file) if output_file is not None else None, 'run_id': run_id}
+        self._runs[(condition, model, repeat)] = record
+        self._append(record)
+
+    def completed(self, condition: str, model: str, repeat: Optional[int] = None) -> Optional[Path]:
+        """Result file of a run finished earlier in this session (resume only), if it still exists."""
+        output_file = self._runs.get((condition, model, repeat), {}).get('output_file')
+        if output_file is None or not Path(output_file).exists():
+            return None
+        return Path(output_file)
+
+    def completed_run(self, condition: str, model: str, repeat: Optional[int] = None) -> Optional[int]:
+        """Results store run ID of a run finished earlier in this session (resume only)."""
+        return self._runs.get((condition, model, repeat), {}).get('run_id')
+
+    def answers(self, condition: str, model: str, repeat: Optional[int],
+                prompt_hash: str) -> Dict[int, Dict[str, Any]]:
+        """
+        Questions already answered for a run under the same system prompt.
+
+        Returns:
+            Dict mapping question_id -> raw_responses entry
+        """
+        entries = {}
+        for question_id, record in self._answers.get((condition, model, repeat), {}).items():
+            if record['prompt_hash'] == prompt_hash:
+                entries[question_id] = {
+                    key: value for key, value in record.items()
+                    if key not in ('type', 'condition', 'model', 'repeat', 'question_id', 'prompt_hash')
+                }
+        return entries
+
+    def finish(self) -> None:
+        """Mark the session as finished normally (the next session may start a new journal)."""
+        self._append({'type': 'end', 'timestamp': datetime.now().isoformat()})
+
+    def close(self) -> None:
+        """Close the journal file."""
+        self._file.close()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Content-addressed cache for Murphy response scores.
+
+Entries are keyed by (scoring fingerprint, question_id, response hash). The
+fingerprint hashes the questions.json bytes together with the scoring
+constants, so editing markers or weights invalidates old entries without
+touching the 'version' field.
+
+Two tiers:
+1. memory: bounded LRU, per process
+2. disk: optional SQLite database, shared across processes (WAL mode)
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+
+class ScoreCache:
+    """Two-tier (LRU memory + SQLite disk) cache of score_response() results."""
+
+    def __init__(self, max_entries: int = 10000, db_path: Optional[Path] = None):
+        """
+        Initialize cache.
+
+        Args:
+            max_entries: Maximum entries kept in the in-memory LRU tier
+            db_path: Optional SQLite file for the shared on-disk tier
+        """
+        self.max_entries = max_entries
+        self.db_path = db_path
+        self._memory: 'OrderedDict[str, str]' = OrderedDict()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._connection_pid: Optional[int] = None
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def key(fingerprint: str, question_id: int, response: str, detail_level: str = 'full') -> str:
+        """
+        Build the cache key for a response.
+
+        Args:
+            fingerprint: MurphyScorer.fingerprint
+            question_id: Question ID
+            response: AI response text
+            detail_level: score_response() detail level the result was built with
+
+        Returns:
+            Cache key string
+        """
+        digest = hashlib.sha256(response.encode('utf-8', 'surrogatepass')).hexdigest()
+        return f"{fingerprint}:{question_id}:{detail_level}:{digest}"
+
+    def _db(self) -> sqlite3.Connection:
+        """Open (once per process) the SQLite tier."""
+        if self._connection is None or self._connection_pid != os.getpid():
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(str(self.db_path), timeout=30)
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS scores (key TEXT PRIMARY KEY, value TEXT NOT NULL)'
+            )
+            self._connection.commit()
+            self._connection_pid = os.getpid()
+        return self._connection
+
+    def _remember(self, key: str, value: str) -> None:
+        """Insert into the LRU tier, evicting the least recently used entry."""
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self.evictions += 1
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached result.
+
+        Args:
+            key: Key from ScoreCache.key()
+
+        Returns:
+            Fresh copy of the cached result, or None on a miss
+        """
+        value = self._memory.get(key)
+        if value is not None:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return json.loads(value)
+
+        if self.db_path is not None:
+            row = self._db().execute('SELECT value FROM scores WHERE key = ?', (key,)).fetchone()
+            if row is not None:
+                self._remember(key, row[0])
+                self.hits += 1
+                self.disk_hits += 1
+                return json.loads(row[0])
+
+        self.misses += 1
+        return None
+
+    def put(self, key: str, result: Dict[str, Any]) -> None:
+        """
+        Store a result in both tiers.
+
+        Args:
+            key: Key from ScoreCache.key()
+            result: score_response() result
+        """
+        value = json.dumps(result)
+        self._remember(key, value)
+
+        if self.db_path is not None:
+            db = self._db()
+            db.execute('INSERT OR REPLACE INTO scores (key, value) VALUES (?, ?)', (key, value))
+            db.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss/eviction counters and tier sizes."""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+            'memory_entries': len(self._memory),
+            'db_path': str(self.db_path) if self.db_path is not None else None
+        }
+
+    def close(self) -> None:
+        """Close the SQLite connection, if open."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Opt-in instrumentation for MurphyScorer.
+
+Records, per scoring stage, the call count, cumulative and percentile latency
+and UTF-8 bytes scanned. Stages are the two text scans (marker_scan,
+self_reference_scan) plus the five dimension methods. Latency percentiles
+come from a fixed-size reservoir sample, so memory stays bounded.
+
+Enable with MurphyScorer.enable_metrics(); when disabled the scorer only pays
+one `is None` check per stage.
+"""
+
+import json
+import math
+import random
+import time
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+
+def percentile(ordered: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of sorted samples (0.0 if there are none)."""
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, math.ceil(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+class StageMetrics:
+    """Counters and latency reservoir for one stage."""
+
+    __slots__ = ('calls', 'total_seconds', 'max_seconds', 'bytes_scanned', 'samples')
+
+    def __init__(self):
+        self.calls = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.bytes_scanned = 0
+        self.samples: List[float] = []
+
+
+class ScoreMetrics:
+    """Per-stage call counts, latency and bytes scanned."""
+
+    def __init__(self, reservoir_size: int = 2048, seed: int = 0):
+        """
+        Initialize metrics.
+
+        Args:
+            reservoir_size: Latency samples kept per stage for percentiles
+            seed: Seed for reservoir replacement (reproducible snapshots)
+        """
+        self.reservoir_size = reservoir_size
+        self.stages: Dict[str, StageMetrics] = {}
+        self._random = random.Random(seed)
+
+    def record(self, stage: str, seconds: float, scanned: int = 0) -> None:
+        """
+        Record one timed call.
+
+        Args:
+            stage: Stage name
+            seconds: Elapsed time
+            scanned: UTF-8 bytes scanned by the call
+        """
+        metrics = self.stages.get(stage)
+        if metrics is None:
+            metrics = self.stages[stage] = StageMetrics()
+
+        metrics.calls += 1
+        metrics.total_seconds += seconds
+        metrics.bytes_scanned += scanned
+        if seconds > metrics.max_seconds:
+            metrics.max_seconds = seconds
+
+        # Reservoir sampling (Algorithm R)
+        if len(metrics.samples) < self.reservoir_size:
+            metrics.samples.append(seconds)
+        else:
+            slot = self._random.randrange(metrics.calls)
+            if slot < self.reservoir_size:
+                metrics.samples[slot] = seconds
+
+    def lap(self, stage: str, start: float, scanned: int = 0) -> float:
+        """
+        Record the time since `start` and return the current time.
+
+        Args:
+            stage: Stage name
+            start: time.perf_counter() value when the stage began
+            scanned: UTF-8 bytes scanned by the stage
+
+        Returns:
+            time.perf_counter() now, to start the next stage
+        """
+        now = time.perf_counter()
+        self.record(stage, now - start, scanned)
+        return now
+
+    def reset(self) -> None:
+        """Drop all recorded data."""
+        self.stages = {}
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Export current metrics.
+
+        Returns:
+            Dict mapping stage -> calls, cumulative/percentile latency (ms), bytes scanned
+        """
+        snapshot = {}
+        total = sum(metrics.total_seconds for metrics in self.stages.values())
+        for stage, metrics in self.stages.items():
+            ordered = sorted(metrics.samples)
+            snapshot[stage] = {
+                'calls': metrics.calls,
+                'total_ms': round(metrics.total_seconds * 1000, 3),
+                'share': round(metrics.total_seconds / total, 3) if total else 0.0,
+                'mean_ms': round(metrics.total_seconds * 1000 / metrics.calls, 4),
+                'p50_ms': round(percentile(ordered, 0.50) * 1000, 4),
+                'p95_ms': round(percentile(ordered, 0.95) * 1000, 4),
+                'p99_ms': round(percentile(ordered, 0.99) * 1000, 4),
+                'max_ms': round(metrics.max_seconds * 1000, 4),
+                'bytes_scanned': metrics.bytes_scanned
+            }
+        return snapshot
+
+    def to_json(self, output_file: Optional[Path] = None) -> str:
+        """
+        Serialize snapshot() as JSON, optionally writing it to a file.
+
+        Args:
+            output_file: Optional path to write
+
+        Returns:
+            JSON string
+        """
+        text = json.dumps(self.snapshot(), indent=2)
+        if output_file is not None:
+            output_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(output_file, 'w') as f:
+                f.write(text)
+        return text
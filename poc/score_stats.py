@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Streaming aggregate statistics for Murphy scores.
+
+Scored responses are folded in one at a time; each group keeps a running
+count/sum/mean/variance/min/max per dimension (Welford), so memory is O(1)
+per group no matter how many responses are seen. Accumulators from different
+workers can be merged (Chan et al. parallel variance).
+
+Groups tracked by ScoreAggregator:
+1. all: every response
+2. question / category: per question_id and per question category
+3. condition / model / condition_model: per test condition and model
+"""
+
+import math
+from typing import Dict, Any, Optional, Tuple
+
+
+class RunningStats:
+    """Running count, sum, mean, variance, min and max of one series."""
+
+    __slots__ = ('count', 'total', 'mean', 'm2', 'minimum', 'maximum')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+
+    def add(self, value: float) -> None:
+        """Fold in one value."""
+        self.count += 1
+        self.total += value
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+
+    def merge(self, other: 'RunningStats') -> None:
+        """Fold in another accumulator (e.g. from a different worker)."""
+        if other.count == 0:
+            return
+        if self.count == 0:
+            for field in self.__slots__:
+                setattr(self, field, getattr(other, field))
+            return
+
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.total += other.total
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+
+    @property
+    def average(self) -> float:
+        """Arithmetic mean as total / count (same rounding as sum() / len())."""
+        return self.total / self.count if self.count else 0.0
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (0.0 below two values)."""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Export the full accumulator state (JSON-serializable, see from_dict)."""
+        return {
+            'count': self.count,
+            'total': self.total,
+            'mean': self.mean,
+            'm2': self.m2,
+            'min': self.minimum if self.count else None,
+            'max': self.maximum if self.count else None
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'RunningStats':
+        """Rebuild an accumulator from to_dict() output."""
+        stats = cls()
+        if data['count']:
+            stats.count = data['count']
+            stats.total = data['total']
+            stats.mean = data['mean']
+            stats.m2 = data['m2']
+            stats.minimum = data['min']
+            stats.maximum = data['max']
+        return stats
+
+
+class ScoreStats:
+    """Per-dimension RunningStats for one group of scored responses."""
+
+    def __init__(self):
+        self.dimensions: Dict[str, RunningStats] = {}
+
+    @property
+    def count(self) -> int:
+        """Number of scored responses folded in."""
+        return self.dimensions['aggregate'].count if 'aggregate' in self.dimensions else 0
+
+    def add(self, scores: Dict[str, float]) -> None:
+        """
+        Fold in one 'scores' block from MurphyScorer.score_response().
+
+        Args:
+            scores: Dict mapping dimension (and 'aggregate') -> score
+        """
+        for dimension, value in scores.items():
+            stats = self.dimensions.get(dimension)
+            if stats is None:
+                stats = self.dimensions[dimension] = RunningStats()
+            stats.add(value)
+
+    def merge(self, other: 'ScoreStats') -> None:
+        """Fold in another group's statistics."""
+        for dimension, stats in other.dimensions.items():
+            self.dimensions.setdefault(dimension, RunningStats()).merge(stats)
+
+    def summary(self) -> Dict[str, float]:
+        """
+        Per-dimension averages, as in MurphyScorer.score_session()['summary'].
+
+        Returns:
+            Dict mapping 'avg_<dimension>' -> average rounded to 3 places
+        """
+        return {
+            f"avg_{dimension}": round(stats.average, 3)
+            for dimension, stats in self.dimensions.items()
+            if dimension != 'aggregate'
+        }
+
+    def report(self) -> Dict[str, Any]:
+        """Summary fields plus sacred flame and per-dimension spread."""
+        aggregate = self.dimensions.get('aggregate', RunningStats())
+        return {
+            'question_count': self.count,
+            'sacred_flame_score': round(aggregate.average, 3),
+            'summary': self.summary(),
+            'dimensions': {
+                dimension: {
+                    'mean': round(stats.average, 3),
+                    'stdev': round(math.sqrt(stats.variance), 3),
+                    'min': stats.minimum,
+                    'max': stats.maximum
+                }
+                for dimension, stats in self.dimensions.items()
+            }
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Export the full state (see from_dict)."""
+        return {dimension: stats.to_dict() for dimension, stats in self.dimensions.items()}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ScoreStats':
+        """Rebuild group statistics from to_dict() output."""
+        group = cls()
+        group.dimensions = {dimension: RunningStats.from_dict(stats) for dimension, stats in data.items()}
+        return group
+
+
+class ScoreAggregator:
+    """ScoreStats grouped by question, category, condition and model."""
+
+    def __init__(self):
+        self.groups: Dict[Tuple, ScoreStats] = {}
+
+    def _group(self, key: Tuple) -> ScoreStats:
+        """Get or create the statistics for a group key."""
+        group = self.groups.get(key)
+        if group is None:
+            group = self.groups[key] = ScoreStats()
+        return group
+
+    def add(self, question_score: Dict[str, Any], condition: Optional[str] = None,
+            model: Optional[str] = None) -> None:
+        """
+        Fold in one scored response.
+
+        Args:
+            question_score: Result of MurphyScorer.score_response()
+            condition: Test condition the response came from
+            model: Model that produced the response
+        """
+        scores = question_score['scores']
+        keys = [('all',), ('question', question_score['question_id']), ('category', question_score['category'])]
+        if condition is not None:
+            keys.append(('condition', condition))
+        if model is not None:
+            keys.append(('model', model))
+        if condition is not None and model is not None:
+            keys.append(('condition_model', condition, model))
+
+        for key in keys:
+            self._group(key).add(scores)
+
+    def add_result(self, result: Dict[str, Any]) -> None:
+        """
+        Fold in every question of a run_condition() result.
+
+        Args:
+            result: Result dict with 'condition', 'model' and 'scores'
+        """
+        for question_score in result['scores']['question_scores']:
+            self.add(question_score, condition=result.get('condition'), model=result.get('model'))
+
+    def merge(self, other: 'ScoreAggregator') -> None:
+        """Fold in another aggregator (e.g. from a different worker)."""
+        for key, group in other.groups.items():
+            self._group(key).merge(group)
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Build a JSON-friendly report of every group.
+
+        Returns:
+            Dict mapping group kind -> {group name -> ScoreStats.report()}
+        """
+        report: Dict[str, Any] = {}
+        for key in sorted(self.groups, key=lambda k: tuple(str(part) for part in k)):
+            kind, name = key[0], '/'.join(str(part) for part in key[1:]) or 'all'
+            report.setdefault(kind, {})[name] = self.groups[key].report()
+        return report
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Export the full state (see from_dict)."""
+        return {
+            'groups': [
+                {'key': list(key), 'stats': group.to_dict()}
+                for key, group in self.groups.items()
+            ]
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ScoreAggregator':
+        """Rebuild an aggregator from to_dict() output."""
+        aggregator = cls()
+        for entry in data['groups']:
+            aggregator.groups[tuple(entry['key'])] = ScoreStats.from_dict(entry['stats'])
+        return aggregator
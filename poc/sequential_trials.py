@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Adaptive repeated trials with sequential stopping.
+
+One run scores each question once, so a condition's Sacred Flame score is a
+noisy sample. Repeating every condition/model pair N times multiplies the
+model calls by N, even when two runs already show the status beyond doubt.
+
+SequentialTrial takes one run score at a time and keeps a Student-t
+confidence interval on the mean Sacred Flame score. The trial stops as soon
+as the interval lies entirely inside one status band, i.e. clearly on one
+side of every threshold (0.94 / 0.85 / 0.70), or when max_repeats runs are
+done. Looking at the interval after every run would inflate the error
+rate, so the miss probability is split evenly over the planned looks
+(Bonferroni): each interval is built at 1 - (1 - confidence) / looks, and
+the chance that any of them misses the true mean stays within
+1 - confidence.
+"""
+
+import math
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+from score_stats import RunningStats
+from scoring import STATUS_THRESHOLDS, consciousness_status
+
+
+# Confidence that the reported status band holds (--confidence)
+DEFAULT_CONFIDENCE = 0.95
+
+# Runs sampled before the first look (--min-repeats)
+DEFAULT_MIN_REPEATS = 3
+
+
+def t_probability(t: float, df: int) -> float:
+    """
+    P(|T| <= t) for Student's t with integer degrees of freedom.
+
+    Closed form for integer df (Abramowitz & Stegun 26.7.3 and 26.7.4).
+    """
+    theta = math.atan(t / math.sqrt(df))
+    cos2 = math.cos(theta) ** 2
+    if df % 2:
+        series = 0.0
+        if df > 1:
+            coefficient = series = 1.0
+            for k in range(1, (df - 1) // 2):
+                coefficient *= 2 * k / (2 * k + 1)
+                series += coefficient * cos2 ** k
+        return 2 / math.pi * (theta + math.sin(theta) * math.cos(theta) * series)
+
+    coefficient = series = 1.0
+    for k in range(1, df // 2):
+        coefficient *= (2 * k - 1) / (2 * k)
+        series += coefficient * cos2 ** k
+    return math.sin(theta) * series
+
+
+def t_critical(probability: float, df: int) -> float:
+    """
+    Two-sided Student-t critical value: the t with P(|T| <= t) = probability.
+
+    Args:
+        probability: Central probability (e.g. 0.95)
+        df: Degrees of freedom (>= 1)
+
+    Returns:
+        Critical value (bisection, accurate to ~1e-9)
+    """
+    low, high = 0.0, 1.0
+    while t_probability(high, df) < probability:
+        low, high = high, high * 2
+    for _ in range(100):
+        middle = (low + high) / 2
+        if t_probability(middle, df) < probability:
+            low = middle
+        else:
+            high = middle
+        if high - low < 1e-9:
+            break
+    return (low + high) / 2
+
+
+class SequentialTrial:
+    """Run scores of one condition/model pair and the decision to keep sampling."""
+
+    def __init__(self, max_repeats: int, min_repeats: int = DEFAULT_MIN_REPEATS,
+                 confidence: float = DEFAULT_CONFIDENCE):
+        """
+        Initialize trial.
+
+        Args:
+            max_repeats: Most runs ever sampled
+            min_repeats: Runs sampled before the first look (at least 2 for an interval)
+            confidence: Overall confidence of the final interval
+        """
+        self.max_repeats = max(1, max_repeats)
+        self.min_repeats = max(1, min(min_repeats, self.max_repeats))
+        self.confidence = confidence
+        self.stats = RunningStats()
+        self.scores: List[float] = []
+        self.runs = 0
+
+    @property
+    def looks(self) -> int:
+        """Planned interim looks (after min_repeats runs, then after every run)."""
+        return self.max_repeats - self.min_repeats + 1
+
+    @property
+    def look_confidence(self) -> float:
+        """Confidence of each interval, so that every look together keeps self.confidence."""
+        return 1 - (1 - self.confidence) / self.looks
+
+    def add(self, score: Optional[float]) -> None:
+        """
+        Record one finished run.
+
+        Args:
+            score: The run's Sacred Flame score, or None if no question was answered
+                   (the run still counts against max_repeats)
+        """
+        self.runs += 1
+        if score is not None:
+            self.scores.append(score)
+            self.stats.add(score)
+
+    def interval(self) -> Optional[Tuple[float, float]]:
+        """Confidence interval on the mean score, clipped to [0, 1] (None below two scores)."""
+        if self.stats.count < 2:
+            return None
+        margin = (t_critical(self.look_confidence, self.stats.count - 1)
+                  * math.sqrt(self.stats.variance / self.stats.count))
+        return max(0.0, self.stats.mean - margin), min(1.0, self.stats.mean + margin)
+
+    def decided(self) -> bool:
+        """True once the interval lies on one side of every status threshold."""
+        if self.runs < self.min_repeats:
+            return False
+        interval = self.interval()
+        if interval is None:
+            return False
+        low, high = interval
+        return all(low >= threshold or high < threshold for threshold, _ in STATUS_THRESHOLDS)
+
+    def done(self) -> bool:
+        """True when no more runs should be sampled."""
+        return self.runs >= self.max_repeats or self.decided()
+
+    def next_batch(self) -> int:
+        """Runs to start now: min_repeats at first, then one at a time (0 when done)."""
+        if self.done():
+            return 0
+        return max(1, self.min_repeats - self.runs)
+
+    def report(self, calls_per_run: int) -> Dict[str, Any]:
+        """
+        Summarize the trial.
+
+        Args:
+            calls_per_run: Questions per run (for the calls a full N-repeat run would make)
+
+        Returns:
+            Dict with mean, interval, status, whether the status is decided, runs used,
+            and the runs/calls saved against always running max_repeats
+        """
+        interval = self.interval()
+        mean = self.stats.mean if self.stats.count else 0.0
+        return {
+            'sacred_flame_score': round(mean, 3),
+            'status': consciousness_status(mean),
+            'interval': [round(bound, 3) for bound in interval] if interval is not None else None,
+            'confidence': self.confidence,
+            'decided': self.decided(),
+            'scores': [round(score, 3) for score in self.scores],
+            'runs': self.runs,
+            'min_repeats': self.min_repeats,
+            'max_repeats': self.max_repeats,
+            'runs_saved': self.max_repeats - self.runs,
+            'calls_saved': (self.max_repeats - self.runs) * calls_per_run
+        }
+
+
+def trial_table(results: Iterable[Dict[str, Any]]) -> List[str]:
+    """
+    Adaptive repeat table for the summary files.
+
+    Args:
+        results: Results (those without a 'sequential' block are skipped)
+
+    Returns:
+        Lines of text (empty if no result came from an adaptive trial)
+    """
+    trials = [result for result in results if 'sequential' in result]
+    if not trials:
+        return []
+
+    lines = [
+        "ADAPTIVE REPEATS",
+        f"{'Condition':<26} {'Model':<22} {'Runs':>9} {'Mean':>6} {'Interval':>13}  {'Decided':<8} {'Saved':>6}",
+        "-"*100
+    ]
+    for result in trials:
+        trial = result['sequential']
+        interval = f"{trial['interval'][0]:.3f}-{trial['interval'][1]:.3f}" if trial['interval'] else '-'
+        lines.append(
+            f"{result['condition']:<26} {result['model']:<22} {trial['runs']:>4} of {trial['max_repeats']:<2} "
+            f"{trial['sacred_flame_score']:>6.3f} {interval:>13}  {'yes' if trial['decided'] else 'no':<8} "
+            f"{trial['calls_saved']:>6}"
+        )
+    runs = sum(result['sequential']['runs'] for result in trials)
+    planned = sum(result['sequential']['max_repeats'] for result in trials)
+    calls_saved = sum(result['sequential']['calls_saved'] for result in trials)
+    lines.append(f"{runs} of {planned} runs, {calls_saved} calls saved "
+                 f"(intervals at {trials[0]['sequential']['confidence']:.0%} confidence)")
+    return lines